@@ -1,7 +1,8 @@
 from numbers import Number
-from typing import TypeVar, Generic, List, Union
+from typing import TypeVar, Generic, Dict, List, Optional, Tuple, Union
 
 T = TypeVar('T')
+H = TypeVar('H')
 
 
 def min_order(a: Number, b: Number) -> bool:
@@ -28,7 +29,6 @@ class binheap(Generic[T]):
         else:
             self._size = len(A)
             self._A = A
-            self._B = [i for i in range(self._size)]
 
         self._build_heap()
 
@@ -51,6 +51,11 @@ class binheap(Generic[T]):
     def right(node: int) -> int:
         return 2 * node + 2
 
+    def _parent_of(self, node: int) -> Union[int, None]:
+        # The parent in the tree of this heap, which subclasses with a
+        # different arity override
+        return binheap.parent(node)
+
     def __len__(self):
         return self._size
 
@@ -61,9 +66,6 @@ class binheap(Generic[T]):
         tmp = self._A[node_a]
         self._A[node_a] = self._A[node_b]
         self._A[node_b] = tmp
-        tmp = self._B[node_a]
-        self._B[node_a] = self._B[node_b]
-        self._B[node_b] = tmp
 
     def _heapify(self, node: int) -> None:
         keep_fixing = True
@@ -105,13 +107,13 @@ class binheap(Generic[T]):
         self.decreaser(node)
 
     def decreaser(self, node: int) -> None:
-        parent = binheap.parent(node)
+        parent = self._parent_of(node)
 
         while node != 0 and not self._torder(self._A[parent], self._A[node]):
             self._swap_keys(node, parent)
 
             node = parent
-            parent = binheap.parent(node)
+            parent = self._parent_of(node)
 
     def insert(self, value: T) -> None:
         if self._size >= len(self._A):
@@ -121,7 +123,7 @@ class binheap(Generic[T]):
             self._A[0] = value
             self._size += 1
         else:
-            parent = binheap.parent(self._size)
+            parent = self._parent_of(self._size)
             if self._torder(self._A[parent], value):
                 self._A[self._size] = value
                 self._size += 1
@@ -148,3 +150,156 @@ class binheap(Generic[T]):
             up_to = 2 * up_to
 
         return bh_str
+
+
+class indexed_binheap(Generic[T]):
+    '''
+    A binary heap of keys addressed by stable handles: the position of
+    every handle in the heap is kept in a dictionary updated on every
+    move, so that the key of any handle can be decreased, and the handle
+    itself removed, in time O(log n).
+    '''
+
+    def __init__(self, A: Optional[Union[Dict[H, T], List[Tuple[H, T]]]] = None, total_order=None):
+
+        if total_order is None:
+            self._torder = min_order
+        else:
+            self._torder = total_order
+        if A is None:
+            A = []
+        elif isinstance(A, dict):
+            A = A.items()
+        self._keys = []
+        self._handles = []
+        self._position = {}
+        self._next_handle = 0
+        for handle, key in A:
+            if handle in self._position:
+                raise RuntimeError(f'{handle} is already in the heap')
+            self._position[handle] = len(self._keys)
+            self._handles.append(handle)
+            self._keys.append(key)
+
+        self._build_heap()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def is_empty(self) -> bool:
+        return len(self._keys) == 0
+
+    def __contains__(self, handle: H) -> bool:
+        return handle in self._position
+
+    def contains(self, handle: H) -> bool:
+        return handle in self._position
+
+    def key(self, handle: H) -> T:
+        return self._keys[self._get_position(handle)]
+
+    def minimum(self) -> Tuple[H, T]:
+        if self.is_empty():
+            raise RuntimeError('The heap is empty')
+        return self._handles[0], self._keys[0]
+
+    def _get_position(self, handle: H) -> int:
+        try:
+            return self._position[handle]
+        except KeyError:
+            raise RuntimeError(f'{handle} is not in the heap') from None
+
+    def _place(self, node: int, handle: H, key: T) -> None:
+        self._keys[node] = key
+        self._handles[node] = handle
+        self._position[handle] = node
+
+    def _heapify(self, node: int) -> None:
+        # Move the key down leaving a hole rather than swapping it at
+        # every level
+        keys, handles, torder = self._keys, self._handles, self._torder
+        size = len(keys)
+        handle, key = handles[node], keys[node]
+        child = 2 * node + 1
+        while child < size:
+            if child + 1 < size and not torder(keys[child], keys[child + 1]):
+                child += 1
+            if torder(key, keys[child]):
+                break
+            self._place(node, handles[child], keys[child])
+            node = child
+            child = 2 * node + 1
+        self._place(node, handle, key)
+
+    def decreaser(self, node: int) -> None:
+        keys, handles, torder = self._keys, self._handles, self._torder
+        handle, key = handles[node], keys[node]
+        while node != 0:
+            parent = (node - 1) // 2
+            if torder(keys[parent], key):
+                break
+            self._place(node, handles[parent], keys[parent])
+            node = parent
+        self._place(node, handle, key)
+
+    def _build_heap(self) -> None:
+        for i in range(len(self._keys) // 2 - 1, -1, -1):
+            self._heapify(i)
+
+    def insert(self, key: T, handle: Optional[H] = None) -> H:
+        '''
+        Insert `key` in the heap and return the handle addressing it,
+        which is `handle` or, if it is None, a new integer.
+        '''
+        if handle is None:
+            while self._next_handle in self._position:
+                self._next_handle += 1
+            handle = self._next_handle
+            self._next_handle += 1
+        elif handle in self._position:
+            raise RuntimeError(f'{handle} is already in the heap')
+
+        self._keys.append(key)
+        self._handles.append(handle)
+        self._position[handle] = len(self._keys) - 1
+        self.decreaser(len(self._keys) - 1)
+
+        return handle
+
+    def remove_minimum(self) -> H:
+        if self.is_empty():
+            raise RuntimeError('The heap is empty')
+        handle = self._handles[0]
+        self._remove_at(0)
+
+        return handle
+
+    def remove(self, handle: H) -> T:
+        ''' Remove `handle` from the heap and return its key '''
+        node = self._get_position(handle)
+        key = self._keys[node]
+        self._remove_at(node)
+
+        return key
+
+    def _remove_at(self, node: int) -> None:
+        del self._position[self._handles[node]]
+        last_key = self._keys.pop()
+        last_handle = self._handles.pop()
+        if node < len(self._keys):
+            self._place(node, last_handle, last_key)
+            if node != 0 and not self._torder(self._keys[(node - 1) // 2], last_key):
+                self.decreaser(node)
+            else:
+                self._heapify(node)
+
+    def decrease_key(self, handle: H, new_value: T) -> None:
+        node = self._get_position(handle)
+        if not self._torder(new_value, self._keys[node]):
+            raise RuntimeError(f'{new_value} is not smaller than ' + f'{self._keys[node]}')
+
+        self._keys[node] = new_value
+        self.decreaser(node)
+
+    def __repr__(self) -> str:
+        return repr([(self._handles[i], self._keys[i]) for i in range(len(self._keys))])
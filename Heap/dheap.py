@@ -0,0 +1,87 @@
+from typing import List, Union
+
+from Heap.binheap import binheap, T
+
+
+class dheap(binheap[T]):
+    '''
+    A heap whose nodes have `arity` children rather than two. The tree is
+    shallower, so inserting and decreasing a key take fewer comparisons
+    than in a binary heap, i.e. O(log n / log arity), at the price of
+    `arity` comparisons per level when the minimum is removed.
+    '''
+
+    DEFAULT_ARITY = 4
+
+    def __init__(self, A: Union[int, List[T]], total_order=None, arity: int = DEFAULT_ARITY):
+        if not isinstance(arity, int) or arity < 2:
+            raise ValueError(f'{arity} is not a valid arity')
+        self._arity = arity
+
+        super().__init__(A, total_order)
+
+    @property
+    def arity(self) -> int:
+        return self._arity
+
+    # Unlike those of binheap, the index helpers depend on the arity of
+    # the tree, hence they are instance methods
+
+    def parent(self, node: int) -> Union[int, None]:
+        if node == 0:
+            return None
+
+        return (node - 1) // self._arity
+
+    def child(self, node: int, side: int) -> int:
+        return self._arity * node + 1 + side
+
+    def left(self, node: int) -> int:
+        # The leftmost child, i.e. child(node, 0)
+        return self._arity * node + 1
+
+    def right(self, node: int) -> int:
+        # The rightmost child, i.e. child(node, arity - 1)
+        return self._arity * node + self._arity
+
+    def _parent_of(self, node: int) -> Union[int, None]:
+        return self.parent(node)
+
+    def _heapify(self, node: int) -> None:
+        A, size, torder = self._A, self._size, self._torder
+
+        while True:
+            min_node = node
+            first_child = self._arity * node + 1
+            for child_idx in range(first_child, min(first_child + self._arity, size)):
+                if torder(A[child_idx], A[min_node]):
+                    min_node = child_idx
+            # min_node is the index of the minimum key among the keys of root and its children
+            if min_node == node:
+                return
+            self._swap_keys(min_node, node)
+            node = min_node
+
+    def _build_heap(self) -> None:
+        # The leaves are already heaps
+        for i in range((self._size - 2) // self._arity, -1, -1):
+            self._heapify(i)
+
+    def __repr__(self) -> str:
+        dh_str = ''
+
+        next_node = 0
+        level_size = 1
+
+        while next_node < self._size:
+            level = '\t'.join(f'{v}' for v in self._A[next_node: min(next_node + level_size, self._size)])
+
+            if next_node == 0:
+                dh_str = level
+            else:
+                dh_str += f'\n{level}'
+
+            next_node += level_size
+            level_size *= self._arity
+
+        return dh_str
@@ -0,0 +1,306 @@
+''' Benchmark the matrix multiplication engines of `matrix.py`
+
+Every engine is run over a set of shapes: after some warmup runs, the
+median of several timed runs and the peak of the memory allocated during
+a further run, as traced by `tracemalloc`, are recorded. The results are
+written as JSON and, when a baseline produced by a previous run is given,
+the measures exceeding those of the baseline by more than a tolerance are
+reported as regressions and the command exits with status 1. A baseline
+run with a different backend, element type or Strassen's cutoff is refused.
+
+Example
+-------
+    python benchmark.py --sizes 64 128 --shapes 64x256x32 --output base.json
+    python benchmark.py --sizes 64 128 --shapes 64x256x32 --baseline base.json
+'''
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+from random import randrange, seed
+from statistics import median
+from timeit import default_timer as timer
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+
+import matrix
+from matrix import Matrix
+
+# The engines that can be benchmarked, by name
+ENGINES = {
+    'gauss': matrix.gauss_matrix_mult,
+    'tiled': matrix.tiled_matrix_mult,
+    'strassen': matrix.strassen_matrix_mult,
+    'strassen_memory_efficent': matrix.strassen_matrix_mult_memory_efficent,
+    'strassen_zero_copy': matrix.strassen_matrix_mult_zero_copy,
+    'winograd': matrix.strassen_winograd_matrix_mult,
+    'non_power': matrix.strassen_matrix_mult_non_power,
+    'non_power_memory': matrix.strassen_matrix_mult_non_power_memory,
+    'winograd_non_power': matrix.strassen_winograd_matrix_mult_non_power,
+    'matrix_mult': matrix.matrix_mult,
+}
+
+DEFAULT_ENGINES = ['gauss', 'tiled', 'strassen_zero_copy', 'winograd', 'non_power', 'matrix_mult']
+DEFAULT_SIZES = [32, 64, 128]
+
+# The settings that must agree between a report and its baseline, since
+# the measures taken under different ones are not comparable
+COMPARED_SETTINGS = ['backend', 'dtype', 'strassen_cutoff']
+
+Shape = Tuple[int, int, int]
+
+
+def parse_shape(shape: str) -> Shape:
+    ''' Parse a shape written as ROWSxINNERxCOLS
+
+    Parameters
+    ----------
+    shape: str
+        The shape of the product of a ROWSxINNER matrix by an INNERxCOLS one
+
+    Returns
+    -------
+    Tuple[int, int, int]
+        The number of rows, the inner dimension and the number of columns
+    '''
+    try:
+        rows, inner, cols = (int(x) for x in shape.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError('{} is not a valid shape'.format(shape))
+    if min(rows, inner, cols) < 1:
+        raise argparse.ArgumentTypeError('{} is not a valid shape'.format(shape))
+
+    return rows, inner, cols
+
+
+def random_matrix(rows: int, cols: int, dtype: str) -> Matrix:
+    return Matrix([[randrange(1 << 8) for x in range(cols)] for y in range(rows)], dtype=dtype)
+
+
+def measure(funct, A: Matrix, B: Matrix, warmup: int, repeat: int) -> dict:
+    ''' Time `funct(A, B)` and trace the memory it allocates
+
+    Parameters
+    ----------
+    funct:
+        The engine to be measured
+    A: Matrix
+        The first operand
+    B: Matrix
+        The second operand
+    warmup: int
+        The number of untimed runs preceding the timed ones
+    repeat: int
+        The number of timed runs
+
+    Returns
+    -------
+    dict
+        The times of the runs, their median and the peak, in bytes, of the
+        memory allocated by one further run
+    '''
+    for i in range(warmup):
+        funct(A, B)
+
+    times = []
+    for i in range(repeat):
+        start = timer()
+        funct(A, B)
+        times.append(timer() - start)
+
+    # Tracing slows the allocations down, hence it is kept off the timings
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        funct(A, B)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {'median_time': median(times), 'times': times, 'peak_memory': peak}
+
+
+def run_benchmark(engines: List[str], shapes: List[Shape], warmup: int = 1, repeat: int = 5,
+                  dtype: str = matrix.DEFAULT_DTYPE, random_seed: int = 0) -> dict:
+    ''' Run every engine over every shape
+
+    Parameters
+    ----------
+    engines: List[str]
+        The names of the engines, i.e. keys of `ENGINES`
+    shapes: List[Tuple[int, int, int]]
+        The shapes of the products
+    warmup: Optional[int]
+        The number of untimed runs per engine and shape
+    repeat: Optional[int]
+        The number of timed runs per engine and shape
+    dtype: Optional[str]
+        The element type of the operands
+    random_seed: Optional[int]
+        The seed of the operands' entries
+
+    Returns
+    -------
+    dict
+        The description of the host and of the settings under 'metadata'
+        and one entry per engine and shape under 'results'
+    '''
+    seed(random_seed)
+
+    results = []
+    for shape in shapes:
+        rows, inner, cols = shape
+        A = random_matrix(rows, inner, dtype)
+        B = random_matrix(inner, cols, dtype)
+        for engine in engines:
+            result = {'engine': engine, 'shape': list(shape)}
+            result.update(measure(ENGINES[engine], A, B, warmup, repeat))
+            results.append(result)
+
+    metadata = {
+        'backend': matrix.BACKEND,
+        'dtype': dtype,
+        'strassen_cutoff': matrix.get_strassen_cutoff(dtype=dtype),
+        'warmup': warmup,
+        'repeat': repeat,
+        'seed': random_seed,
+        'python': platform.python_version(),
+        'numpy': None if matrix.np is None else matrix.np.__version__,
+        'machine': platform.machine(),
+    }
+
+    return {'metadata': metadata, 'results': results}
+
+
+def compare(report: dict, baseline: dict, time_tolerance: float = 0.1,
+            memory_tolerance: float = 0.1) -> List[dict]:
+    ''' Find the measures exceeding those of a baseline
+
+    Parameters
+    ----------
+    report: dict
+        The output of `run_benchmark`
+    baseline: dict
+        The output of a previous `run_benchmark`
+    time_tolerance: Optional[float]
+        The relative increase of the median time deemed a regression
+    memory_tolerance: Optional[float]
+        The relative increase of the memory peak deemed a regression
+
+    Returns
+    -------
+    List[dict]
+        One entry per regression, reporting the engine, the shape, the
+        measure and its values in the baseline and in the report. The
+        engines and shapes missing from the baseline are ignored
+
+    Raises
+    ------
+    ValueError
+        If the report and the baseline were run with a different backend,
+        element type or Strassen's cutoff
+    '''
+    mismatches = ['{} is {} rather than {}'.format(key, report['metadata'].get(key),
+                                                   baseline['metadata'].get(key))
+                  for key in COMPARED_SETTINGS
+                  if report['metadata'].get(key) != baseline['metadata'].get(key)]
+    if mismatches:
+        raise ValueError('The baseline is not comparable: ' + ', '.join(mismatches))
+
+    reference = {(r['engine'], tuple(r['shape'])): r for r in baseline['results']}
+
+    regressions = []
+    for result in report['results']:
+        key = (result['engine'], tuple(result['shape']))
+        if key not in reference:
+            continue
+        for measure_name, tolerance in (('median_time', time_tolerance),
+                                        ('peak_memory', memory_tolerance)):
+            old, new = reference[key][measure_name], result[measure_name]
+            if new > old * (1 + tolerance):
+                regressions.append({'engine': result['engine'], 'shape': result['shape'],
+                                    'measure': measure_name, 'baseline': old, 'value': new})
+
+    return regressions
+
+
+def format_report(report: dict, regressions: Optional[List[dict]] = None) -> str:
+    flagged = set()
+    if regressions is not None:
+        flagged = {(r['engine'], tuple(r['shape']), r['measure']) for r in regressions}
+
+    lines = ['{:<26}{:>18}{:>14}{:>14}'.format('engine', 'shape', 'median (s)', 'peak (KiB)')]
+    for result in report['results']:
+        key = (result['engine'], tuple(result['shape']))
+        time_mark = '*' if key + ('median_time',) in flagged else ' '
+        memory_mark = '*' if key + ('peak_memory',) in flagged else ' '
+        lines.append('{:<26}{:>18}{:>13.4f}{}{:>13.1f}{}'.format(
+            result['engine'], 'x'.join(str(x) for x in result['shape']),
+            result['median_time'], time_mark, result['peak_memory'] / 1024, memory_mark))
+    if flagged:
+        lines.append('* regression with respect to the baseline')
+
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the matrix multiplication engines.')
+    parser.add_argument('--engines', nargs='+', default=DEFAULT_ENGINES, choices=sorted(ENGINES),
+                        metavar='ENGINE', help='the engines to be run, among: ' + ', '.join(sorted(ENGINES)))
+    parser.add_argument('--sizes', nargs='*', type=int, default=None,
+                        help='the sizes of square products (default: {})'.format(
+                            ' '.join(str(size) for size in DEFAULT_SIZES)))
+    parser.add_argument('--shapes', nargs='*', type=parse_shape, default=[],
+                        help='the shapes of rectangular products, as ROWSxINNERxCOLS')
+    parser.add_argument('--backend', choices=['python', 'numpy'], default=None)
+    parser.add_argument('--dtype', choices=sorted(matrix.DTYPES), default=matrix.DEFAULT_DTYPE)
+    parser.add_argument('--warmup', type=int, default=1, help='untimed runs per measure')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per measure')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help='the JSON file of the results (default: stdout)')
+    parser.add_argument('--baseline', default=None, help='a JSON file of previous results')
+    parser.add_argument('--time-tolerance', type=float, default=0.1,
+                        help='the relative slowdown deemed a regression')
+    parser.add_argument('--memory-tolerance', type=float, default=0.1,
+                        help='the relative memory growth deemed a regression')
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error('--repeat must be positive and --warmup non-negative')
+    if args.backend is not None:
+        try:
+            matrix.set_backend(args.backend)
+        except ValueError as e:
+            parser.error(str(e))
+
+    sizes = DEFAULT_SIZES if args.sizes is None and not args.shapes else args.sizes or []
+    shapes = [(size, size, size) for size in sizes] + args.shapes
+
+    report = run_benchmark(args.engines, shapes, args.warmup, args.repeat, args.dtype, args.seed)
+
+    regressions = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        try:
+            regressions = compare(report, baseline, args.time_tolerance, args.memory_tolerance)
+        except ValueError as e:
+            parser.error(str(e))
+        report['regressions'] = regressions
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    sys.stderr.write(format_report(report, regressions) + '\n')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,216 @@
 from __future__ import annotations
-from numbers import Number
-from typing import List, Tuple
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from numbers import Integral, Number
+from itertools import repeat
+from math import inf
+from operator import add, mul, sub
+from typing import List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The element types of the matrices and the typecodes of their buffers
+DTYPES = {'float32': 'f', 'float64': 'd', 'int64': 'q'}
+
+# The element type of the matrices whose type is not specified
+DEFAULT_DTYPE = 'float64'
+
+# The typecode of the buffer storing the values of the default element type
+TYPECODE = DTYPES[DEFAULT_DTYPE]
+
+# The largest absolute values representable by the integer element types
+_INTEGER_BOUNDS = {'int64': (1 << 63) - 1}
+
+# The header of the binary matrix files: magic string, format version,
+# typecode, byte order of the values and numbers of rows and columns.
+# Its size is a multiple of 8, so that the values are aligned
+MATRIX_FILE_HEADER = struct.Struct('<4sBccxQQ')
+MATRIX_FILE_MAGIC = b'MTRX'
+MATRIX_FILE_VERSION = 1
+
+# The backend used by the multiplication and sum kernels: 'numpy' whenever
+# NumPy can be imported, 'python' otherwise
+BACKEND = 'python' if np is None else 'numpy'
+
+
+def set_backend(backend: str) -> None:
+    ''' Select the backend used by the multiplication and sum kernels
+
+    Parameters
+    ----------
+    backend: str
+        Either 'python', for the pure Python kernels, or 'numpy'
+
+    Raises
+    ------
+    ValueError
+        If `backend` is unknown or NumPy is not available
+    '''
+    global BACKEND
+
+    if backend not in ('python', 'numpy'):
+        raise ValueError('{} is not a valid backend'.format(backend))
+    if backend == 'numpy' and np is None:
+        raise ValueError('NumPy is not available')
+
+    BACKEND = backend
+
+
+# The file storing the Strassen cutoffs calibrated on this host
+CALIBRATION_FILE = os.environ.get('MATRIX_CALIBRATION_FILE',
+                                  os.path.join(os.path.expanduser('~'), '.matrix_calibration.json'))
+
+# The Strassen cutoffs used by the backends that have not been calibrated
+DEFAULT_STRASSEN_CUTOFFS = {'python': 32, 'numpy': 512}
+
+# The cutoffs read from `CALIBRATION_FILE`, loaded on first use
+_calibrated_cutoffs = None
+
+
+def _load_calibration(path: Optional[str] = None) -> dict:
+    if path is None:
+        path = CALIBRATION_FILE
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _calibration_key(backend: Optional[str], dtype: str) -> str:
+    return '{}/{}'.format(BACKEND if backend is None else backend, dtype)
+
+
+def get_strassen_cutoff(backend: Optional[str] = None, dtype: str = 'float64') -> int:
+    ''' Return the size below which Strassen's algorithm switches to Gauss's
+
+    Parameters
+    ----------
+    backend: Optional[str]
+        The backend of interest. It defaults to the current backend
+    dtype: Optional[str]
+        The element type of interest
+
+    Returns
+    -------
+    int
+        The cutoff calibrated on this host by `calibrate_strassen_cutoff`
+        or, if the calibration has never been run, a default value
+    '''
+    global _calibrated_cutoffs
+
+    if _calibrated_cutoffs is None:
+        _calibrated_cutoffs = _load_calibration()
+
+    if backend is None:
+        backend = BACKEND
+
+    return _calibrated_cutoffs.get(_calibration_key(backend, dtype),
+                                   DEFAULT_STRASSEN_CUTOFFS[backend])
+
+
+def _typecode_of(dtype: str) -> str:
+    if dtype not in DTYPES:
+        raise ValueError('{} is not a valid dtype'.format(dtype))
+
+    return DTYPES[dtype]
+
+
+def _dtype_of(typecode: str) -> str:
+    for dtype, dtype_typecode in DTYPES.items():
+        if dtype_typecode == typecode:
+            return dtype
+
+    raise ValueError('{} is not a valid typecode'.format(typecode))
+
+
+def _promote(A: Matrix, B: Matrix) -> str:
+    ''' Return the element type of a combination of `A` and `B`
+
+    Matrices of the same type give that type, any other pair gives
+    `DEFAULT_DTYPE`, which represents exactly all the values of the other
+    types.
+    '''
+    return A.dtype if A.dtype == B.dtype else DEFAULT_DTYPE
+
+
+def _shares_buffer(A: Matrix, B: Matrix) -> bool:
+    ''' Whether the values of `A` and `B` may lie in the same memory '''
+    if np is not None:
+        return np.shares_memory(A.to_numpy(), B.to_numpy())
+
+    A_buffer, B_buffer = A._data, B._data
+    if isinstance(A_buffer, memoryview):
+        A_buffer = A_buffer.obj
+    if isinstance(B_buffer, memoryview):
+        B_buffer = B_buffer.obj
+
+    return A_buffer is B_buffer
+
+
+def _product_dtype(A: Matrix, B: Matrix, growth: int = 1) -> str:
+    ''' Return the element type of the product of `A` and `B`
+
+    Raises
+    ------
+    OverflowError
+        If the type is an integer one and the values computed are not
+        guaranteed to be representable, i.e. the number of columns of `A`
+        times the largest absolute values of `A` and of `B` times `growth`,
+        the bound on how much the intermediate values of the algorithm can
+        exceed those of the product, exceeds the largest representable value
+    '''
+    dtype = _promote(A, B)
+    if dtype in _INTEGER_BOUNDS and \
+            A._max_abs() * B._max_abs() * A.num_of_cols * growth > _INTEGER_BOUNDS[dtype]:
+        raise OverflowError('The product of the two matrices may overflow {}'.format(dtype))
+
+    return dtype
+
+
+def _strassen_growth(A: Matrix, B: Matrix, cutoff: int) -> int:
+    ''' Bound how much the intermediate values of Strassen's functions can exceed those of the product
+
+    At every level of the recursion the operands of the seven products
+    are sums of at most four quadrants and the results are sums of at most
+    four products, so, after `levels` halvings of the inner dimension, the
+    values are at most 4 * 8^levels times the bound on the product. The
+    NumPy kernels wrap around modulo 2^64, hence their intermediate values
+    may overflow as long as the product does not: the growth is 1.
+    '''
+    if BACKEND == 'numpy':
+        return 1
+
+    levels = 0
+    size = max(A.num_of_rows, A.num_of_cols, B.num_of_cols)
+    while size > 1 and size >= cutoff:
+        size = (size + 1) // 2
+        levels += 1
+
+    return 4 * 8 ** levels if levels else 1
+
+
+def _strassen_dtype(A: Matrix, B: Matrix, cutoff: Optional[int]) -> Tuple[str, int]:
+    ''' Return the element type of the product of `A` and `B` computed by Strassen's functions and their cutoff
+
+    The overflow of integer products is checked once here, for all the
+    levels of the recursion.
+    '''
+    dtype = _promote(A, B)
+    if cutoff is None:
+        cutoff = get_strassen_cutoff(dtype=dtype)
+    _product_dtype(A, B, _strassen_growth(A, B, cutoff))
+
+    return dtype, cutoff
 
 
 def gauss_matrix_mult(A: Matrix, B: Matrix) -> Matrix:
@@ -16,26 +226,139 @@ def gauss_matrix_mult(A: Matrix, B: Matrix) -> Matrix:
     Returns
     -------
     Matrix
-        The row-column multiplication of the matrices passed as parameters
+        The row-column multiplication of the matrices passed as parameters.
+        It has their element type if they have the same one and
+        `DEFAULT_DTYPE` otherwise
 
     Raises
     ------
     ValueError
         If the number of columns of `A` is different from the number of
         rows of `B`
+    OverflowError
+        If the matrices are integer ones and the product may overflow
     '''
     if A.num_of_cols != B.num_of_rows:
         raise ValueError('The two matrices cannot be multiplied')
-    result = [[0 for col in range(B.num_of_cols)] for row in range(A.num_of_rows)]
+    result = Matrix.zeros(A.num_of_rows, B.num_of_cols, _product_dtype(A, B))
+    _gauss_into(result, A, B)
+
+    return result
+
+
+def _gauss_into(C: Matrix, A: Matrix, B: Matrix, accumulate: bool = False) -> None:
+    ''' Store the row-column multiplication of `A` and `B` into `C`
+
+    `C` may be a view on a larger matrix: all its values are overwritten
+    or, when `accumulate` is set, increased by the product.
+    '''
+    if BACKEND == 'numpy':
+        if accumulate:
+            C.to_numpy()[...] += np.matmul(A.to_numpy(), B.to_numpy())
+        else:
+            np.matmul(A.to_numpy(), B.to_numpy(), out=C.to_numpy())
+    else:
+        _gauss_into_python(C, A, B, accumulate)
+
+
+def _gauss_into_python(C: Matrix, A: Matrix, B: Matrix, accumulate: bool = False) -> None:
+    A_data, B_data, data = A._data, B._data, C._data
+    B_stride = B._stride
 
     for row in range(A.num_of_rows):
+        A_row = A._row_begin(row)
+        C_row = C._row_begin(row)
         for col in range(B.num_of_cols):
-            value = 0
+            value = data[C_row + col] if accumulate else 0
+            B_pos = B._offset + col
             for k in range(A.num_of_cols):
-                value += A[row][k] * B[k][col]
-            result[row][col] = value
+                value += A_data[A_row + k] * B_data[B_pos]
+                B_pos += B_stride
+            data[C_row + col] = value
+
+
+# The default number of columns of the result computed by each strip of
+# the pure Python tiled kernel. It is also the strip width used by the base
+# case of the Strassen's functions, which reads it at every call
+TILE_SIZE = 64
+
+
+def tiled_matrix_mult(A: Matrix, B: Matrix, tile_size: Optional[int] = None) -> Matrix:
+    ''' Multiply two matrices by using a cache-blocked classical algorithm
+
+    The columns of `B` are extracted once and the result is computed in
+    strips of `tile_size` columns: for every strip all the rows of `A` are
+    swept, so that the strip's columns of `B` stay in cache, and each entry
+    is the dot product of a row of `A` and a column of `B` evaluated by a
+    single pass over two contiguous buffers. The 'numpy' backend computes
+    the product by a single `matmul`, which is already blocked by BLAS.
+
+    Parameters
+    ----------
+    A: Matrix
+        The first matrix to be multiplied
+    B: Matrix
+        The second matrix to be multiplied
+    tile_size: Optional[int]
+        The number of columns of each strip of the result. It defaults to
+        `TILE_SIZE` and it is ignored by the 'numpy' backend
+
+    Returns
+    -------
+    Matrix
+        The row-column multiplication of the matrices passed as parameters,
+        with the element type given by `gauss_matrix_mult`
+
+    Raises
+    ------
+    ValueError
+        If the number of columns of `A` is different from the number of
+        rows of `B`
+    OverflowError
+        If the matrices are integer ones and the product may overflow
+    '''
+    if A.num_of_cols != B.num_of_rows:
+        raise ValueError('The two matrices cannot be multiplied')
+    result = Matrix.zeros(A.num_of_rows, B.num_of_cols, _product_dtype(A, B))
+    if BACKEND == 'numpy':
+        _gauss_into(result, A, B)
+    else:
+        _tiled_into_python(result, A, B, False, TILE_SIZE if tile_size is None else tile_size)
+
+    return result
+
 
-    return Matrix(result, clone_matrix=False)
+def _base_into(C: Matrix, A: Matrix, B: Matrix, accumulate: bool = False) -> None:
+    ''' Store the product of `A` and `B` into `C` by the fastest classical kernel
+
+    This is the base case of all the Strassen's functions. The pure Python
+    kernel works on strips of `TILE_SIZE` columns: the strip width of the
+    base case is set by changing the module constant.
+    '''
+    if BACKEND == 'numpy':
+        _gauss_into(C, A, B, accumulate)
+    else:
+        _tiled_into_python(C, A, B, accumulate, TILE_SIZE)
+
+
+def _tiled_into_python(C: Matrix, A: Matrix, B: Matrix, accumulate: bool, tile_size: int) -> None:
+    rows, inner, cols = A.num_of_rows, A.num_of_cols, B.num_of_cols
+    A_data, B_data, data = A._data, B._data, C._data
+    typecode = C._typecode
+    B_end = B._offset + inner * B._stride
+    B_cols = [B_data[B._offset + col:B_end:B._stride] for col in range(cols)]
+
+    for col_tile in range(0, cols, tile_size):
+        col_end = min(col_tile + tile_size, cols)
+        tile_cols = B_cols[col_tile:col_end] if col_end - col_tile < cols else B_cols
+        for row in range(rows):
+            A_begin = A._row_begin(row)
+            A_row = A_data[A_begin:A_begin + inner]
+            begin = C._row_begin(row)
+            values = array(typecode, [sum(map(mul, A_row, B_col)) for B_col in tile_cols])
+            if accumulate:
+                values = array(typecode, map(add, data[begin + col_tile:begin + col_end], values))
+            data[begin + col_tile:begin + col_end] = values
 
 
 def get_matrix_quadrant(A: Matrix) -> Tuple[Matrix, Matrix, Matrix, Matrix]:
@@ -46,9 +369,30 @@ def get_matrix_quadrant(A: Matrix) -> Tuple[Matrix, Matrix, Matrix, Matrix]:
     return A11, A12, A21, A22
 
 
-def strassen_matrix_mult(A: Matrix, B: Matrix) -> Matrix:
-    if max(A.num_of_rows, B.num_of_cols, A.num_of_cols) < 32:
-        return gauss_matrix_mult(A, B)
+def strassen_matrix_mult(A: Matrix, B: Matrix, cutoff: Optional[int] = None,
+                         workers: Optional[int] = None) -> Matrix:
+    dtype, cutoff = _strassen_dtype(A, B, cutoff)
+    if workers is not None and workers > 1:
+        return _parallel_strassen(A, B, strassen_matrix_mult, cutoff, workers)
+
+    return _strassen_recursive(A, B, cutoff, dtype)
+
+
+def _base_product(A: Matrix, B: Matrix, dtype: str) -> Matrix:
+    result = Matrix.zeros(A.num_of_rows, B.num_of_cols, dtype)
+    _base_into(result, A, B)
+
+    return result
+
+
+def _strassen_recursive(A: Matrix, B: Matrix, cutoff: int, dtype: str) -> Matrix:
+    if max(A.num_of_rows, B.num_of_cols, A.num_of_cols) < cutoff:
+        return _base_product(A, B, dtype)
+    if A.num_of_rows % 2 or A.num_of_cols % 2 or B.num_of_cols % 2:
+        result = Matrix.zeros(A.num_of_rows, B.num_of_cols, dtype)
+        _peel_into(result, A, B,
+                   lambda C, A, B: C.assign_submatrix(0, 0, _strassen_recursive(A, B, cutoff, dtype)))
+        return result
 
     # Recursive step
     A11, A12, A21, A22 = get_matrix_quadrant(A)
@@ -67,35 +411,44 @@ def strassen_matrix_mult(A: Matrix, B: Matrix) -> Matrix:
     S10 = B11 + B12
 
     # Recursive calls
-    P1 = strassen_matrix_mult(A11, S1)
-    P2 = strassen_matrix_mult(S2, B22)
-    P3 = strassen_matrix_mult(S3, B11)
-    P4 = strassen_matrix_mult(A22, S4)
-    P5 = strassen_matrix_mult(S5, S6)
-    P6 = strassen_matrix_mult(S7, S8)
-    P7 = strassen_matrix_mult(S9, S10)
-
-    # Second batch of sums Theta(n^2)
-    C11 = P5 + P4 - P2 + P6
-    C12 = P1 + P2
-    C21 = P3 + P4
-    C22 = P5 + P1 - P3 - P7
+    P1 = _strassen_recursive(A11, S1, cutoff, dtype)
+    P2 = _strassen_recursive(S2, B22, cutoff, dtype)
+    P3 = _strassen_recursive(S3, B11, cutoff, dtype)
+    P4 = _strassen_recursive(A22, S4, cutoff, dtype)
+    P5 = _strassen_recursive(S5, S6, cutoff, dtype)
+    P6 = _strassen_recursive(S7, S8, cutoff, dtype)
+    P7 = _strassen_recursive(S9, S10, cutoff, dtype)
 
     # Built the resulting matrix
-    result = Matrix([[0 for i in range(B.num_of_cols)] for y in range(A.num_of_rows)], clone_matrix=False)
+    result = Matrix.zeros(A.num_of_rows, B.num_of_cols, dtype)
+    C11, C12, C21, C22 = get_matrix_quadrant_views(result)
 
-    # copying Cij into the resulting matrix
-    result.assign_submatrix(0, 0, C11)
-    result.assign_submatrix(0, result.num_of_cols // 2, C12)
-    result.assign_submatrix(result.num_of_rows // 2, 0, C21)
-    result.assign_submatrix(result.num_of_rows // 2, result.num_of_cols // 2, C22)
+    # Second batch of sums Theta(n^2), evaluated directly into the result
+    (P5.lazy() + P4 - P2 + P6).evaluate(out=C11)
+    (P1.lazy() + P2).evaluate(out=C12)
+    (P3.lazy() + P4).evaluate(out=C21)
+    (P5.lazy() + P1 - P3 - P7).evaluate(out=C22)
 
     return result
 
 
-def strassen_matrix_mult_memory_efficent(A: Matrix, B: Matrix) -> Matrix:
-    if max(A.num_of_rows, B.num_of_cols, A.num_of_cols) < 32:
-        return gauss_matrix_mult(A, B)
+def strassen_matrix_mult_memory_efficent(A: Matrix, B: Matrix, cutoff: Optional[int] = None,
+                                         workers: Optional[int] = None) -> Matrix:
+    dtype, cutoff = _strassen_dtype(A, B, cutoff)
+    if workers is not None and workers > 1:
+        return _parallel_strassen(A, B, strassen_matrix_mult_memory_efficent, cutoff, workers)
+
+    return _memory_efficent_recursive(A, B, cutoff, dtype)
+
+
+def _memory_efficent_recursive(A: Matrix, B: Matrix, cutoff: int, dtype: str) -> Matrix:
+    if max(A.num_of_rows, B.num_of_cols, A.num_of_cols) < cutoff:
+        return _base_product(A, B, dtype)
+    if A.num_of_rows % 2 or A.num_of_cols % 2 or B.num_of_cols % 2:
+        result = Matrix.zeros(A.num_of_rows, B.num_of_cols, dtype)
+        _peel_into(result, A, B,
+                   lambda C, A, B: C.assign_submatrix(0, 0, _memory_efficent_recursive(A, B, cutoff, dtype)))
+        return result
     # Recursive step
     A11, A12, A21, A22 = get_matrix_quadrant(A)
     B11, B12, B21, B22 = get_matrix_quadrant(B)
@@ -103,7 +456,7 @@ def strassen_matrix_mult_memory_efficent(A: Matrix, B: Matrix) -> Matrix:
     # First batch of sum Theta(n^2)
     P1 = B12 - B22
 
-    P1 = strassen_matrix_mult_memory_efficent(A11, P1)
+    P1 = _memory_efficent_recursive(A11, P1, cutoff, dtype)
 
     C12 = P1
 
@@ -111,7 +464,7 @@ def strassen_matrix_mult_memory_efficent(A: Matrix, B: Matrix) -> Matrix:
 
     P1 = A11 + A12
 
-    P1 = strassen_matrix_mult_memory_efficent(P1, B22)
+    P1 = _memory_efficent_recursive(P1, B22, cutoff, dtype)
 
     C12 = C12 + P1
 
@@ -119,7 +472,7 @@ def strassen_matrix_mult_memory_efficent(A: Matrix, B: Matrix) -> Matrix:
 
     P1 = A21 + A22
 
-    P1 = strassen_matrix_mult_memory_efficent(P1, B11)
+    P1 = _memory_efficent_recursive(P1, B11, cutoff, dtype)
 
     C22 = C22 - P1
 
@@ -127,7 +480,7 @@ def strassen_matrix_mult_memory_efficent(A: Matrix, B: Matrix) -> Matrix:
 
     P1 = B21 - B11
 
-    P1 = strassen_matrix_mult_memory_efficent(A22, P1)
+    P1 = _memory_efficent_recursive(A22, P1, cutoff, dtype)
 
     C11 = P1 - C11
 
@@ -137,7 +490,7 @@ def strassen_matrix_mult_memory_efficent(A: Matrix, B: Matrix) -> Matrix:
 
     S2 = B11 + B22
 
-    P1 = strassen_matrix_mult_memory_efficent(P1, S2)
+    P1 = _memory_efficent_recursive(P1, S2, cutoff, dtype)
 
     C11 = C11 + P1
 
@@ -147,7 +500,7 @@ def strassen_matrix_mult_memory_efficent(A: Matrix, B: Matrix) -> Matrix:
 
     S2 = B21 + B22
 
-    P1 = strassen_matrix_mult_memory_efficent(P1, S2)
+    P1 = _memory_efficent_recursive(P1, S2, cutoff, dtype)
 
     C11 = C11 + P1
 
@@ -155,12 +508,12 @@ def strassen_matrix_mult_memory_efficent(A: Matrix, B: Matrix) -> Matrix:
 
     S2 = B11 + B12
 
-    P1 = strassen_matrix_mult_memory_efficent(P1, S2)
+    P1 = _memory_efficent_recursive(P1, S2, cutoff, dtype)
 
     C22 = C22 - P1
 
     # Built the resulting matrix
-    result = Matrix([[0 for i in range(B.num_of_cols)] for y in range(A.num_of_rows)], clone_matrix=False)
+    result = Matrix.zeros(A.num_of_rows, B.num_of_cols, dtype)
 
     # copying Cij into the resulting matrix
     result.assign_submatrix(0, 0, C11)
@@ -171,327 +524,2932 @@ def strassen_matrix_mult_memory_efficent(A: Matrix, B: Matrix) -> Matrix:
     return result
 
 
-def strassen_matrix_mult_non_power(A: Matrix, B: Matrix) -> Matrix:
-    if A.num_of_cols != B.num_of_rows:
-        raise ValueError('The two matrices cannot be multiplied')
-    A_squared_rows = find_nearest_power(A.num_of_rows)
-    A_squared_cols = find_nearest_power(A.num_of_cols)
-    B_squared_cols = find_nearest_power(B.num_of_cols)
-    Matrices_dimension = max(A_squared_rows, A_squared_cols, B_squared_cols)
-    A_squared = square_matrix(A, Matrices_dimension, 0)
-    B_squared = square_matrix(B, Matrices_dimension, 0)
-    result = strassen_matrix_mult(A_squared, B_squared)
-    result = trim_square(result, A.num_of_rows, B.num_of_cols)
-    return result
+def get_matrix_quadrant_views(A: Matrix) -> Tuple[Matrix, Matrix, Matrix, Matrix]:
+    ''' Return the four quadrants of `A` as views sharing its buffer '''
+    rows, cols = A.num_of_rows // 2, A.num_of_cols // 2
+    A11 = A.view(0, rows, 0, cols)
+    A12 = A.view(0, rows, cols, cols)
+    A21 = A.view(rows, rows, 0, cols)
+    A22 = A.view(rows, rows, cols, cols)
+    return A11, A12, A21, A22
 
 
-def strassen_matrix_mult_non_power_memory(A: Matrix, B: Matrix) -> Matrix:
-    if A.num_of_cols != B.num_of_rows:
-        raise ValueError('The two matrices cannot be multiplied')
-    A_squared_rows = find_nearest_power(A.num_of_rows)
-    A_squared_cols = find_nearest_power(A.num_of_cols)
-    B_squared_cols = find_nearest_power(B.num_of_cols)
-    Matrices_dimension = max(A_squared_rows, A_squared_cols, B_squared_cols)
-    A_squared = square_matrix(A, Matrices_dimension, 0)
-    B_squared = square_matrix(B, Matrices_dimension, 0)
-    result = strassen_matrix_mult_memory_efficent(A_squared, B_squared)
-    result = trim_square(result, A.num_of_rows, B.num_of_cols)
-    return result
+def _add_into(C: Matrix, A: Matrix, B: Matrix, op=add) -> None:
+    ''' Store `op(A, B)`, evaluated elementwise, into `C` '''
+    if BACKEND == 'numpy':
+        _NUMPY_UFUNCS[op](A.to_numpy(), B.to_numpy(), out=C.to_numpy())
+        return
 
+    data, A_data, B_data, cols = C._data, A._data, B._data, C.num_of_cols
+    for y in range(C.num_of_rows):
+        begin, A_begin, B_begin = C._row_begin(y), A._row_begin(y), B._row_begin(y)
+        data[begin:begin + cols] = array(
+            C._typecode, map(op, A_data[A_begin:A_begin + cols],
+                               B_data[B_begin:B_begin + cols]))
 
-def find_nearest_power(Dimension: int) -> int:
-    result = 2
-    while result < Dimension:
-        result *= 2
-    return result
 
+# The NumPy counterparts of the elementwise operators used by the kernels
+_NUMPY_UFUNCS = {} if np is None else {add: np.add, sub: np.subtract}
 
-def square_matrix(A: Matrix, Dim: int, Number: int) -> Matrix:
-    result = Matrix([[Number for i in range(Dim)] for y in range(Dim)])
-    for row in range(A.num_of_rows):
-        for col in range(A.num_of_cols):
-            result[row][col] = A[row][col]
-    return result
 
+def _is_worth_splitting(rows: int, inner: int, cols: int, cutoff: int) -> bool:
+    ''' Decide whether a product deserves one more level of Strassen's recursion
 
-def trim_square(A: Matrix, Rows: int, Cols: int) -> Matrix:
-    result = Matrix([[A[y][i] for i in range(Cols)] for y in range(Rows)])
-    return result
+    One level saves an eighth of the multiplications and costs a number of
+    sums proportional to the areas of the operands and of the result, so
+    the shape is measured by the harmonic mean of its three dimensions:
+    it equals the size of a square product and it is close to the smallest
+    dimension of a very unbalanced one, which is thus left to Gauss's
+    algorithm.
+    '''
+    if min(rows, inner, cols) < 2:
+        return False
 
+    return 3 * rows * inner * cols >= cutoff * (rows * inner + inner * cols + rows * cols)
 
-class Matrix(object):
-    ''' A simple naive matrix class
 
-    Members
+def _peel_into(C: Matrix, A: Matrix, B: Matrix, core) -> None:
+    ''' Store the product of `A` and `B` into `C` by peeling odd dimensions
+
+    The largest even-sized block of the product is computed by
+    `core(C, A, B)`; the last row, the last column and the last term of
+    the inner sum, when the corresponding dimension is odd, are then fixed
+    by the classical algorithm, which costs only Theta(n^2).
+    '''
+    rows, inner, cols = A.num_of_rows, A.num_of_cols, B.num_of_cols
+    even_rows, even_inner, even_cols = rows - rows % 2, inner - inner % 2, cols - cols % 2
+
+    C_core = C.view(0, even_rows, 0, even_cols)
+    core(C_core, A.view(0, even_rows, 0, even_inner), B.view(0, even_inner, 0, even_cols))
+
+    if even_inner != inner:
+        _base_into(C_core, A.view(0, even_rows, even_inner, 1),
+                    B.view(even_inner, 1, 0, even_cols), accumulate=True)
+    if even_cols != cols:
+        _base_into(C.view(0, even_rows, even_cols, 1), A.view(0, even_rows, 0, inner),
+                    B.view(0, inner, even_cols, 1))
+    if even_rows != rows:
+        _base_into(C.view(even_rows, 1, 0, cols), A.view(even_rows, 1, 0, inner), B)
+
+
+def _strassen_workspace(rows: int, inner: int, cols: int, cutoff: int,
+                        dtype: str = DEFAULT_DTYPE) -> List[Tuple[Matrix, Matrix, Matrix]]:
+    ''' Allocate the temporaries needed by `_strassen_into`
+
+    All the temporaries are carved out of a single buffer: for every
+    recursion level there is one operand for `A`'s side, one for `B`'s
+    side and one for the partial product.
+
+    Parameters
+    ----------
+    rows: int
+        The number of rows of the left operand
+    inner: int
+        The number of columns of the left operand
+    cols: int
+        The number of columns of the right operand
+    cutoff: int
+        The size below which the recursion switches to Gauss's algorithm
+    dtype: Optional[str]
+        The element type of the temporaries
+
+    Returns
     -------
-    _A: List[List[Number]]
-        The list of rows that store all the matrix values
+    List[Tuple[Matrix, Matrix, Matrix]]
+        The temporaries of each recursion level
+    '''
+    levels = []
+    while _is_worth_splitting(rows, inner, cols, cutoff):
+        rows, inner, cols = rows // 2, inner // 2, cols // 2
+        levels.append((rows, inner, cols))
+
+    data = array(_typecode_of(dtype), [0]) * sum(r * i + i * c + r * c for r, i, c in levels)
+
+    workspace = []
+    offset = 0
+    for r, i, c in levels:
+        S_A = Matrix._wrap(data, r, i, offset)
+        S_B = Matrix._wrap(data, i, c, offset + r * i)
+        P = Matrix._wrap(data, r, c, offset + r * i + i * c)
+        workspace.append((S_A, S_B, P))
+        offset += r * i + i * c + r * c
+
+    return workspace
+
+
+def _strassen_into(C: Matrix, A: Matrix, B: Matrix,
+                   workspace: List[Tuple[Matrix, Matrix, Matrix]], depth: int = 0) -> None:
+    ''' Store the product of `A` and `B` into `C` by using Strassen's algorithm
+
+    The quadrants of `A`, `B` and `C` are views and every product is
+    written directly into its destination, so that the only temporaries
+    are those preallocated in `workspace`. Odd dimensions are peeled off
+    at every level, so the operands can have any shape.
+    '''
+    if depth == len(workspace):
+        _base_into(C, A, B)
+        return
+
+    if A.num_of_rows % 2 or A.num_of_cols % 2 or B.num_of_cols % 2:
+        _peel_into(C, A, B, lambda C, A, B: _strassen_into(C, A, B, workspace, depth))
+        return
+
+    S_A, S_B, P = workspace[depth]
+    A11, A12, A21, A22 = get_matrix_quadrant_views(A)
+    B11, B12, B21, B22 = get_matrix_quadrant_views(B)
+    C11, C12, C21, C22 = get_matrix_quadrant_views(C)
+
+    # P5 = (A11 + A22)(B11 + B22) goes to C11 and C22
+    _add_into(S_A, A11, A22)
+    _add_into(S_B, B11, B22)
+    _strassen_into(C11, S_A, S_B, workspace, depth + 1)
+    C22.assign_submatrix(0, 0, C11)
+
+    # P1 = A11(B12 - B22) goes to C12 and C22
+    _add_into(S_B, B12, B22, sub)
+    _strassen_into(C12, A11, S_B, workspace, depth + 1)
+    C22 += C12
+
+    # P2 = (A11 + A12)B22 goes to C12 and C11
+    _add_into(S_A, A11, A12)
+    _strassen_into(P, S_A, B22, workspace, depth + 1)
+    C12 += P
+    C11 -= P
+
+    # P3 = (A21 + A22)B11 goes to C21 and C22
+    _add_into(S_A, A21, A22)
+    _strassen_into(C21, S_A, B11, workspace, depth + 1)
+    C22 -= C21
+
+    # P4 = A22(B21 - B11) goes to C21 and C11
+    _add_into(S_B, B21, B11, sub)
+    _strassen_into(P, A22, S_B, workspace, depth + 1)
+    C21 += P
+    C11 += P
+
+    # P6 = (A12 - A22)(B21 + B22) goes to C11
+    _add_into(S_A, A12, A22, sub)
+    _add_into(S_B, B21, B22)
+    _strassen_into(P, S_A, S_B, workspace, depth + 1)
+    C11 += P
+
+    # P7 = (A11 - A21)(B11 + B12) goes to C22
+    _add_into(S_A, A11, A21, sub)
+    _add_into(S_B, B11, B12)
+    _strassen_into(P, S_A, S_B, workspace, depth + 1)
+    C22 -= P
+
+
+def strassen_matrix_mult_zero_copy(A: Matrix, B: Matrix, cutoff: Optional[int] = None,
+                                   workers: Optional[int] = None) -> Matrix:
+    ''' Multiply two matrices by using Strassen's algorithm without copies
+
+    Quadrants are views on the operands, the temporaries of all the
+    recursion levels are allocated once and the partial products are
+    written directly into the quadrants of the result. The operands can
+    have any shape: odd dimensions are peeled off at every level, rather
+    than padded, and very unbalanced products are left to Gauss's
+    algorithm.
 
     Parameters
     ----------
-    A: List[List[Number]]
-        The list of rows that store all the matrix values
-    clone_matrix: Optional[bool]
-        A flag to require a full copy of `A`'s data structure.
+    A: Matrix
+        The first matrix to be multiplied
+    B: Matrix
+        The second matrix to be multiplied
+    cutoff: Optional[int]
+        The size below which the recursion switches to Gauss's algorithm.
+        It defaults to the cutoff calibrated for the current backend
+    workers: Optional[int]
+        The number of processes computing the products of the topmost
+        recursion levels. By default, the product is computed by the
+        calling process only
+
+    Returns
+    -------
+    Matrix
+        The row-column multiplication of the matrices passed as parameters,
+        with the element type given by `gauss_matrix_mult`
 
     Raises
     ------
     ValueError
-        If there are two lists having a different number of values
+        If the number of columns of `A` is different from the number of
+        rows of `B`
+    OverflowError
+        If the matrices are integer ones and the product may overflow
     '''
+    if A.num_of_cols != B.num_of_rows:
+        raise ValueError('The two matrices cannot be multiplied')
+    dtype, cutoff = _strassen_dtype(A, B, cutoff)
+    if workers is not None and workers > 1:
+        return _parallel_strassen(A, B, strassen_matrix_mult_zero_copy, cutoff, workers)
 
-    def __init__(self, A: List[List[Number]], clone_matrix: bool = True):
-        num_of_cols = None
+    result = Matrix.zeros(A.num_of_rows, B.num_of_cols, dtype)
+    workspace = _strassen_workspace(A.num_of_rows, A.num_of_cols, B.num_of_cols, cutoff, dtype)
+    _strassen_into(result, A, B, workspace)
 
-        for i, row in enumerate(A):
-            if num_of_cols is not None:
-                if num_of_cols != len(row):
-                    raise ValueError('This is not a matrix')
-            else:
-                num_of_cols = len(row)
+    return result
 
-        if clone_matrix:
-            self._A = [[value for value in row] for row in A]
-        else:
-            self._A = A
 
-    @property
-    def num_of_rows(self) -> int:
-        return len(self._A)
+def _winograd_into(C: Matrix, A: Matrix, B: Matrix,
+                   workspace: List[Tuple[Matrix, Matrix, Matrix]], depth: int = 0) -> None:
+    ''' Store the product of `A` and `B` into `C` by using Winograd's variant
 
-    @property
-    def num_of_cols(self) -> int:
-        if len(self._A) == 0:
-            return 0
+    Winograd's variant of Strassen's algorithm performs 7 products and 15
+    sums per level. As in `_strassen_into`, the quadrants are views, the
+    products are written directly into their destinations and the only
+    temporaries are those preallocated in `workspace`.
+    '''
+    if depth == len(workspace):
+        _base_into(C, A, B)
+        return
+
+    if A.num_of_rows % 2 or A.num_of_cols % 2 or B.num_of_cols % 2:
+        _peel_into(C, A, B, lambda C, A, B: _winograd_into(C, A, B, workspace, depth))
+        return
+
+    X, Y, P = workspace[depth]
+    A11, A12, A21, A22 = get_matrix_quadrant_views(A)
+    B11, B12, B21, B22 = get_matrix_quadrant_views(B)
+    C11, C12, C21, C22 = get_matrix_quadrant_views(C)
+
+    # M7 = (A11 - A21)(B22 - B12) goes to C21
+    _add_into(X, A11, A21, sub)
+    _add_into(Y, B22, B12, sub)
+    _winograd_into(C21, X, Y, workspace, depth + 1)
+
+    # M5 = S1 T1 = (A21 + A22)(B12 - B11) goes to C22
+    _add_into(X, A21, A22)
+    _add_into(Y, B12, B11, sub)
+    _winograd_into(C22, X, Y, workspace, depth + 1)
+
+    # M6 = S2 T2 = (S1 - A11)(B22 - T1) goes to C12
+    _add_into(X, X, A11, sub)
+    _add_into(Y, B22, Y, sub)
+    _winograd_into(C12, X, Y, workspace, depth + 1)
+
+    # M1 = A11 B11 is kept in P
+    _winograd_into(P, A11, B11, workspace, depth + 1)
+
+    # C12 = M1 + M6, C21 = C12 + M7, C12 = C12 + M5, C22 = C21 + M5
+    C12 += P
+    C21 += C12
+    C12 += C22
+    C22 += C21
+
+    # M3 = (A12 - S2)B22 is added to C12
+    _add_into(X, A12, X, sub)
+    _winograd_into(C11, X, B22, workspace, depth + 1)
+    C12 += C11
+
+    # M4 = A22(T2 - B21) is subtracted from C21
+    _add_into(Y, Y, B21, sub)
+    _winograd_into(C11, A22, Y, workspace, depth + 1)
+    C21 -= C11
+
+    # C11 = M1 + M2
+    _winograd_into(C11, A12, B21, workspace, depth + 1)
+    C11 += P
+
+
+def strassen_winograd_matrix_mult(A: Matrix, B: Matrix, cutoff: Optional[int] = None,
+                                  workers: Optional[int] = None) -> Matrix:
+    ''' Multiply two matrices by using Winograd's variant of Strassen's algorithm
+
+    Every recursion level performs 15 sums instead of Strassen's 18. Like
+    `strassen_matrix_mult_zero_copy`, it works on quadrant views with a
+    workspace allocated once and it accepts operands of any shape.
 
-        return len(self._A[0])
+    Parameters
+    ----------
+    A: Matrix
+        The first matrix to be multiplied
+    B: Matrix
+        The second matrix to be multiplied
+    cutoff: Optional[int]
+        The size below which the recursion switches to the classical
+        algorithm. It defaults to the cutoff calibrated for the current
+        backend
+    workers: Optional[int]
+        The number of processes computing the products of the topmost
+        recursion levels. By default, the product is computed by the
+        calling process only
 
-    def copy(self):
-        A = [[value for value in row] for row in self._A]
+    Returns
+    -------
+    Matrix
+        The row-column multiplication of the matrices passed as parameters,
+        with the element type given by `gauss_matrix_mult`
 
-        return Matrix(A, clone_matrix=False)
+    Raises
+    ------
+    ValueError
+        If the number of columns of `A` is different from the number of
+        rows of `B`
+    OverflowError
+        If the matrices are integer ones and the product may overflow
+    '''
+    if A.num_of_cols != B.num_of_rows:
+        raise ValueError('The two matrices cannot be multiplied')
+    dtype, cutoff = _strassen_dtype(A, B, cutoff)
+    if workers is not None and workers > 1:
+        return _parallel_strassen(A, B, strassen_winograd_matrix_mult, cutoff, workers)
 
-    def __getitem__(self, y: int):
-        ''' Return one of the rows
+    result = Matrix.zeros(A.num_of_rows, B.num_of_cols, dtype)
+    workspace = _strassen_workspace(A.num_of_rows, A.num_of_cols, B.num_of_cols, cutoff, dtype)
+    _winograd_into(result, A, B, workspace)
 
-        Parameters
-        ----------
-        y: int
-            the index of the rows to be returned
+    return result
 
-        Returns
-        -------
-        List[Number]
-            The `y`-th row of the matrix
-        '''
-        return self._A[y]
 
-    def __iadd__(self, A: Matrix) -> Matrix:
-        ''' Sum a matrix to this matrix and update it
+def _strassen_operands(A: Matrix, B: Matrix) -> List[Tuple[Matrix, Matrix]]:
+    ''' Return the operands of the seven products of one Strassen's level '''
+    A11, A12, A21, A22 = get_matrix_quadrant_views(A)
+    B11, B12, B21, B22 = get_matrix_quadrant_views(B)
 
-        Parameters
-        ----------
-        A: Matrix
-            The matrix to be summed up
+    return [(A11.copy(), B12 - B22),
+            (A11 + A12, B22.copy()),
+            (A21 + A22, B11.copy()),
+            (A22.copy(), B21 - B11),
+            (A11 + A22, B11 + B22),
+            (A12 - A22, B21 + B22),
+            (A11 - A21, B11 + B12)]
 
-        Returns
-        -------
-        Matrix
-            The matrix corresponding to the sum between this matrix and
-            that passed as parameter
 
-        Raises
-        ------
-        ValueError
-            If the two matrices have different sizes
-        '''
+def _strassen_combine(C: Matrix, P: List[Matrix]) -> None:
+    ''' Store into `C` the sums of the seven products of one Strassen's level '''
+    P1, P2, P3, P4, P5, P6, P7 = P
+    C11, C12, C21, C22 = get_matrix_quadrant_views(C)
 
-        if (self.num_of_cols != A.num_of_cols or
-                self.num_of_rows != A.num_of_rows):
-            raise ValueError('The two matrices have different sizes')
+    _add_into(C11, P5, P4)
+    C11 -= P2
+    C11 += P6
+    _add_into(C12, P1, P2)
+    _add_into(C21, P3, P4)
+    _add_into(C22, P5, P1)
+    C22 -= P3
+    C22 -= P7
 
-        for y in range(self.num_of_rows):
-            for x in range(self.num_of_cols):
-                self[y][x] += A[y][x]
 
-        return self
+def _to_shared_memory(A: Matrix) -> shared_memory.SharedMemory:
+    data = A._pack()
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+    shm.buf[:len(data) * data.itemsize] = data.tobytes()
 
-    def __add__(self, A: Matrix) -> Matrix:
-        ''' Sum a matrix to this matrix
+    return shm
 
-        Parameters
-        ----------
-        A: Matrix
-            The matrix to be summed up
 
-        Returns
-        -------
-        Matrix
-            The matrix corresponding to the sum between this matrix and
-            that passed as parameter
+def _from_shared_memory(name: str, num_of_rows: int, num_of_cols: int, dtype: str) -> Matrix:
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = array(_typecode_of(dtype))
+        data.frombytes(shm.buf[:num_of_rows * num_of_cols * data.itemsize])
+    finally:
+        shm.close()
 
-        Raises
-        ------
-        ValueError
-            If the two matrices have different sizes
-        '''
-        res = self.copy()
+    return Matrix._wrap(data, num_of_rows, num_of_cols)
 
-        res += A
 
-        return res
+def _shared_product_task(engine, cutoff: int, backend: str, A_shape: Tuple[str, int, int, str],
+                         B_shape: Tuple[str, int, int, str], C_name: str) -> None:
+    ''' Multiply two matrices stored in shared memory by using `engine`
 
-    def __isub__(self, A: Matrix) -> Matrix:
+    This is the task run by the worker processes: the operands are read
+    from the shared memory blocks named in `A_shape` and `B_shape` and
+    the product is written into the block named `C_name`.
+    '''
+    set_backend(backend)
+
+    C = engine(_from_shared_memory(*A_shape), _from_shared_memory(*B_shape), cutoff)
+
+    shm = shared_memory.SharedMemory(name=C_name)
+    # the block is owned, and eventually unlinked, by the parent process
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    try:
+        data = C._pack()
+        shm.buf[:len(data) * data.itemsize] = data.tobytes()
+    finally:
+        shm.close()
+
+
+def _shared_products(pairs: List[Tuple[Matrix, Matrix]], engine, cutoff: int,
+                     workers: int) -> List[Matrix]:
+    ''' Compute the products of `pairs` in a pool of `workers` processes
+
+    Operands and products are exchanged through shared memory blocks,
+    which are unlinked before returning.
+    '''
+    blocks = []
+    try:
+        tasks = []
+        for A, B in pairs:
+            A_shm, B_shm = _to_shared_memory(A), _to_shared_memory(B)
+            blocks += [A_shm, B_shm]
+            dtype = _promote(A, B)
+            C_shm = shared_memory.SharedMemory(
+                create=True, size=max(1, A.num_of_rows * B.num_of_cols * array(DTYPES[dtype]).itemsize))
+            blocks.append(C_shm)
+            tasks.append(((A_shm.name, A.num_of_rows, A.num_of_cols, A.dtype),
+                          (B_shm.name, B.num_of_rows, B.num_of_cols, B.dtype),
+                          (C_shm.name, A.num_of_rows, B.num_of_cols, dtype)))
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_shared_product_task, engine, cutoff, BACKEND,
+                                   A_shape, B_shape, C_shape[0])
+                       for A_shape, B_shape, C_shape in tasks]
+            for future in futures:
+                future.result()
+
+        return [_from_shared_memory(*C_shape) for A_shape, B_shape, C_shape in tasks]
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def _parallel_strassen(A: Matrix, B: Matrix, engine, cutoff: int, workers: int) -> Matrix:
+    ''' Multiply two matrices by distributing Strassen's products among processes
+
+    The topmost recursion level, or the two topmost ones when there are
+    more than seven workers, is expanded in the calling process and the
+    resulting 7 or 49 products are computed by `engine` in a process pool.
+
+    Parameters
+    ----------
+    A: Matrix
+        The first matrix to be multiplied
+    B: Matrix
+        The second matrix to be multiplied
+    engine: Callable[[Matrix, Matrix, int], Matrix]
+        The sequential Strassen's function computing the products
+    cutoff: int
+        The size below which the recursion switches to Gauss's algorithm
+    workers: int
+        The number of worker processes
+
+    Returns
+    -------
+    Matrix
+        The row-column multiplication of the matrices passed as parameters
+
+    Raises
+    ------
+    ValueError
+        If the number of columns of `A` is different from the number of
+        rows of `B`
+    '''
+    if A.num_of_cols != B.num_of_rows:
+        raise ValueError('The two matrices cannot be multiplied')
+    # The overflow has been checked by the caller
+    dtype = _promote(A, B)
+
+    def parallel_core(C: Matrix, A: Matrix, B: Matrix) -> None:
+        shapes = []
+        pairs = [(A, B)]
+        rows, inner, cols = A.num_of_rows, A.num_of_cols, B.num_of_cols
+        while (len(shapes) < (2 if workers > 7 else 1) and
+               rows % 2 == 0 and inner % 2 == 0 and cols % 2 == 0 and
+               _is_worth_splitting(rows, inner, cols, cutoff)):
+            shapes.append((rows, cols))
+            pairs = [operands for X, Y in pairs for operands in _strassen_operands(X, Y)]
+            rows, inner, cols = rows // 2, inner // 2, cols // 2
+
+        if not shapes:
+            C.assign_submatrix(0, 0, engine(A, B, cutoff))
+            return
+
+        products = _shared_products(pairs, engine, cutoff, workers)
+
+        for rows, cols in reversed(shapes[1:]):
+            results = []
+            for i in range(0, len(products), 7):
+                result = Matrix.zeros(rows, cols, dtype)
+                _strassen_combine(result, products[i:i + 7])
+                results.append(result)
+            products = results
+
+        _strassen_combine(C, products)
+
+    result = Matrix.zeros(A.num_of_rows, B.num_of_cols, dtype)
+    _peel_into(result, A, B, parallel_core)
+
+    return result
+
+
+def calibrate_strassen_cutoff(backend: Optional[str] = None, dtype: str = 'float64',
+                              max_size: Optional[int] = None, repeat: int = 3,
+                              path: Optional[str] = None) -> int:
+    ''' Measure the Strassen cutoff on this host and store it
+
+    For every power of two up to `max_size`, the time of Gauss's algorithm
+    is compared with that of one level of Strassen's recursion over
+    Gauss's algorithm. The cutoff is the smallest size from which the
+    latter is faster, and it is saved in the calibration file so that the
+    Strassen functions use it by default.
+
+    Parameters
+    ----------
+    backend: Optional[str]
+        The backend to be calibrated. It defaults to the current backend
+    dtype: Optional[str]
+        The element type to be calibrated
+    max_size: Optional[int]
+        The largest size to be measured. It defaults to 256 for the
+        'python' backend and to 4096 for the 'numpy' one
+    repeat: Optional[int]
+        The number of timings per size; their median is used
+    path: Optional[str]
+        The calibration file. It defaults to `CALIBRATION_FILE`
+
+    Returns
+    -------
+    int
+        The calibrated cutoff
+    '''
+    global _calibrated_cutoffs
+
+    from random import randrange
+    from timeit import default_timer as timer
+
+    if path is None:
+        path = CALIBRATION_FILE
+    _typecode_of(dtype)
+
+    previous_backend = BACKEND
+    if backend is not None:
+        set_backend(backend)
+    backend = BACKEND
+
+    if max_size is None:
+        max_size = 256 if backend == 'python' else 4096
+
+    def median_time(funct, *args) -> float:
+        times = []
+        for i in range(repeat):
+            start = timer()
+            funct(*args)
+            times.append(timer() - start)
+        return sorted(times)[len(times) // 2]
+
+    try:
+        cutoff = 2 * max_size
+        size = 8
+        while size <= max_size:
+            A = Matrix([[randrange(1 << 16) for x in range(size)] for y in range(size)], dtype=dtype)
+            B = Matrix([[randrange(1 << 16) for x in range(size)] for y in range(size)], dtype=dtype)
+            C = Matrix.zeros(size, size, dtype)
+            workspace = _strassen_workspace(size, size, size, size, dtype)
+
+            if median_time(_strassen_into, C, A, B, workspace) < median_time(_base_into, C, A, B):
+                cutoff = size
+                break
+            size *= 2
+    finally:
+        set_backend(previous_backend)
+
+    cutoffs = _load_calibration(path)
+    cutoffs[_calibration_key(backend, dtype)] = cutoff
+    with open(path, 'w') as f:
+        json.dump(cutoffs, f, indent=2, sort_keys=True)
+
+    if path == CALIBRATION_FILE:
+        _calibrated_cutoffs = cutoffs
+
+    return cutoff
+
+
+def strassen_matrix_mult_non_power(A: Matrix, B: Matrix, cutoff: Optional[int] = None,
+                                   workers: Optional[int] = None) -> Matrix:
+    return strassen_matrix_mult_zero_copy(A, B, cutoff, workers)
+
+
+def strassen_winograd_matrix_mult_non_power(A: Matrix, B: Matrix, cutoff: Optional[int] = None,
+                                            workers: Optional[int] = None) -> Matrix:
+    return strassen_winograd_matrix_mult(A, B, cutoff, workers)
+
+
+def strassen_matrix_mult_non_power_memory(A: Matrix, B: Matrix, cutoff: Optional[int] = None,
+                                          workers: Optional[int] = None) -> Matrix:
+    if A.num_of_cols != B.num_of_rows:
+        raise ValueError('The two matrices cannot be multiplied')
+    # The odd dimensions are peeled at every level of the recursion, so
+    # the operands are not padded to the next power of two
+    return strassen_matrix_mult_memory_efficent(A, B, cutoff, workers)
+
+
+# The density below which `matrix_mult` switches to the sparse kernels
+SPARSE_DENSITY_THRESHOLDS = {'python': 0.1, 'numpy': 0.01}
+
+
+def matrix_mult(A: Union[Matrix, SparseMatrix], B: Union[Matrix, SparseMatrix]) -> Union[Matrix, SparseMatrix]:
+    ''' Multiply two matrices by using the most convenient algorithm
+
+    Products involving a `BandedMatrix`, e.g. a diagonal or a triangular
+    matrix, skip the zeros outside the band. Products involving a
+    `SparseMatrix` use the sparse kernels; a dense
+    operand whose density is below the threshold of the current backend
+    is converted to a `SparseMatrix` first. The remaining products are
+    computed by Winograd's variant of Strassen's algorithm, which leaves
+    small and unbalanced products to the classical kernel.
+
+    Parameters
+    ----------
+    A: Union[Matrix, SparseMatrix]
+        The first matrix to be multiplied
+    B: Union[Matrix, SparseMatrix]
+        The second matrix to be multiplied
+
+    Returns
+    -------
+    Union[Matrix, SparseMatrix]
+        The row-column multiplication of the matrices passed as
+        parameters. It is a `SparseMatrix` if both of them are sparse
+
+    Raises
+    ------
+    ValueError
+        If the number of columns of `A` is different from the number of
+        rows of `B`
+    '''
+    if A.num_of_cols != B.num_of_rows:
+        raise ValueError('The two matrices cannot be multiplied')
+
+    if isinstance(A, BandedMatrix):
+        if isinstance(B, BandedMatrix):
+            return A._mul_banded(B)
+        if isinstance(B, Matrix):
+            return A._mul_dense(B)
+    elif isinstance(B, BandedMatrix) and isinstance(A, Matrix):
+        return B._rmul_dense(A)
+
+    # The result is sparse only if the caller passed two sparse matrices,
+    # so that the type of the product does not depend on the backend
+    sparse_result = isinstance(A, SparseMatrix) and isinstance(B, SparseMatrix)
+    threshold = SPARSE_DENSITY_THRESHOLDS[BACKEND]
+    if not isinstance(A, SparseMatrix) and A.density() < threshold:
+        A = SparseMatrix.from_matrix(A)
+    if not isinstance(B, SparseMatrix) and B.density() < threshold:
+        B = SparseMatrix.from_matrix(B)
+
+    if isinstance(A, SparseMatrix):
+        C = A * B
+    elif isinstance(B, SparseMatrix):
+        C = B.__rmul__(A)
+    else:
+        return strassen_winograd_matrix_mult(A, B)
+
+    if isinstance(C, SparseMatrix) and not sparse_result:
+        return C.to_matrix()
+    return C
+
+
+def batch_matrix_mult(As: List[Matrix], Bs: List[Matrix]) -> List[Matrix]:
+    ''' Multiply many pairs of small matrices at once
+
+    The pairs are grouped by shape and the operands of each group are
+    packed in one contiguous buffer, seen as a three-dimensional array
+    of shape (pairs, rows, cols). The NumPy backend multiplies a whole
+    group by a single call; the pure Python one walks the buffers with
+    one flat loop, avoiding the per-call overhead of the other engines.
+    The results of a group are views on a single buffer too.
+
+    Parameters
+    ----------
+    As: List[Matrix]
+        The first matrices of the pairs
+    Bs: List[Matrix]
+        The second matrices of the pairs
+
+    Returns
+    -------
+    List[Matrix]
+        The row-column multiplications of the pairs, in the same order and
+        with the element types given by `gauss_matrix_mult`
+
+    Raises
+    ------
+    ValueError
+        If the two lists have different lengths or the number of columns
+        of a matrix in `As` is different from the number of rows of the
+        corresponding matrix in `Bs`
+    OverflowError
+        If the matrices of a pair are integer ones and their product may
+        overflow
+    '''
+    if len(As) != len(Bs):
+        raise ValueError('The two batches have different sizes')
+
+    groups = {}
+    for i, (A, B) in enumerate(zip(As, Bs)):
+        if A.num_of_cols != B.num_of_rows:
+            raise ValueError('The two matrices cannot be multiplied')
+        groups.setdefault((A.num_of_rows, A.num_of_cols, B.num_of_cols,
+                           A.dtype, B.dtype, _product_dtype(A, B)), []).append(i)
+
+    results = [None] * len(As)
+    for (rows, inner, cols, A_dtype, B_dtype, dtype), indices in groups.items():
+        A_size, B_size, C_size = rows * inner, inner * cols, rows * cols
+        A_data, B_data = array(DTYPES[A_dtype]), array(DTYPES[B_dtype])
+        A_data.frombytes(b''.join([As[i]._packed() for i in indices]))
+        B_data.frombytes(b''.join([Bs[i]._packed() for i in indices]))
+
+        if BACKEND == 'numpy' and C_size > 0:
+            C = np.matmul(np.frombuffer(A_data, dtype=A_dtype).reshape(len(indices), rows, inner),
+                          np.frombuffer(B_data, dtype=B_dtype).reshape(len(indices), inner, cols))
+            C_data = array(DTYPES[dtype])
+            C_data.frombytes(memoryview(C.astype(dtype, copy=False)).cast('B'))
+        else:
+            C_data = array(DTYPES[dtype], [0]) * (len(indices) * C_size)
+            for A_begin, B_begin, C_begin in zip(range(0, len(A_data), A_size or 1),
+                                                 range(0, len(B_data), B_size or 1),
+                                                 range(0, len(C_data), C_size or 1)):
+                B_cols = [B_data[B_begin + col:B_begin + B_size:cols] for col in range(cols)]
+                C_data[C_begin:C_begin + C_size] = array(C_data.typecode, [
+                    sum(map(mul, A_data[row:row + inner], B_col))
+                    for row in range(A_begin, A_begin + A_size, inner) for B_col in B_cols])
+
+        for n, i in enumerate(indices):
+            results[i] = Matrix._wrap(C_data, rows, cols, n * C_size)
+
+    return results
+
+
+def matrix_power(A: Union[Matrix, SparseMatrix], k: int) -> Matrix:
+    ''' Raise a square matrix to a non-negative integer power
+
+    The power is computed by repeated squaring: `A^k` is the product of
+    the powers `A^(2^i)` such that the `i`-th bit of `k` is set, so only
+    Theta(log k) products are needed. The products are computed by
+    `matrix_mult`, which selects the most convenient algorithm.
+
+    Parameters
+    ----------
+    A: Union[Matrix, SparseMatrix]
+        The matrix to be raised to the power `k`
+    k: int
+        The exponent
+
+    Returns
+    -------
+    Matrix
+        The matrix `A^k`, with the element type of `A`, as a writable
+        dense matrix even if `A` is sparse or banded. It is the identity
+        matrix if `k` is 0
+
+    Raises
+    ------
+    ValueError
+        If `A` is not square or `k` is not a non-negative integer
+    OverflowError
+        If `A` is an integer matrix and a product may overflow
+    '''
+    if A.num_of_rows != A.num_of_cols:
+        raise ValueError('The matrix is not square')
+    if not isinstance(k, int) or k < 0:
+        raise ValueError('The exponent must be a non-negative integer')
+
+    result = IdentityMatrix(A.num_of_rows, A.dtype)
+    while k > 0:
+        if k & 1:
+            result = matrix_mult(result, A)
+        k >>= 1
+        if k > 0:
+            A = matrix_mult(A, A)
+
+    # The identity and the products of two sparse or banded matrices keep
+    # their read-only structure, while the power is a plain dense matrix
+    if isinstance(result, SparseMatrix):
+        result = result.to_matrix()
+    elif type(result) is not Matrix:
+        result = result.copy()
+
+    return result
+
+
+# The size of the blocks of rows and of inner terms combined at once by the
+# NumPy kernel of the tropical products
+TROPICAL_TILE_SIZE = 8
+
+
+def _tropical_into(C: Matrix, A: Matrix, B: Matrix, reduce, tile_size: int) -> None:
+    ''' Store into `C` the product of `A` and `B` in the semiring where `reduce` is the sum
+
+    The value in position (y, x) is `reduce` over k of A[y][k] + B[k][x].
+    '''
+    rows, inner, cols = A.num_of_rows, A.num_of_cols, B.num_of_cols
+    identity = inf if reduce is min else -inf
+
+    if BACKEND == 'numpy':
+        ufunc = np.minimum if reduce is min else np.maximum
+        A_values, B_values, C_values = A.to_numpy(), B.to_numpy(), C.to_numpy()
+        C_values[...] = identity
+        for row in range(0, rows, tile_size):
+            A_tile, C_tile = A_values[row:row + tile_size], C_values[row:row + tile_size]
+            for k in range(0, inner, tile_size):
+                terms = A_tile[:, k:k + tile_size, None] + B_values[None, k:k + tile_size, :]
+                ufunc(C_tile, ufunc.reduce(terms, axis=1), out=C_tile)
+        return
+
+    A_data, B_data, data = A._data, B._data, C._data
+    B_end = B._offset + inner * B._stride
+    B_cols = [B_data[B._offset + col:B_end:B._stride] for col in range(cols)]
+    for row in range(rows):
+        A_begin, begin = A._row_begin(row), C._row_begin(row)
+        A_row = A_data[A_begin:A_begin + inner]
+        data[begin:begin + cols] = array(C._typecode, [reduce(map(add, A_row, B_col), default=identity)
+                                                       for B_col in B_cols])
+
+
+def _tropical_matrix_mult(A: Matrix, B: Matrix, reduce, tile_size: Optional[int]) -> Matrix:
+    if A.num_of_cols != B.num_of_rows:
+        raise ValueError('The two matrices cannot be multiplied')
+
+    dtype = _promote(A, B)
+    if dtype in _INTEGER_BOUNDS:
+        dtype = DEFAULT_DTYPE
+    result = Matrix.zeros(A.num_of_rows, B.num_of_cols, dtype)
+    _tropical_into(result, A, B, reduce, TROPICAL_TILE_SIZE if tile_size is None else tile_size)
+
+    return result
+
+
+def min_plus_matrix_mult(A: Matrix, B: Matrix, tile_size: Optional[int] = None) -> Matrix:
+    ''' Multiply two matrices in the min-plus (tropical) semiring
+
+    The value in position (y, x) of the result is the minimum over k of
+    A[y][k] + B[k][x]: if `A` and `B` store the lengths of the paths
+    between the vertices of a graph, the result stores the lengths of the
+    shortest concatenations of these paths. The NumPy kernel combines
+    blocks of `tile_size` rows and inner terms at once, the pure Python one
+    reduces a row of `A` and a column of `B` in a single pass.
+
+    Parameters
+    ----------
+    A: Matrix
+        The first matrix to be multiplied
+    B: Matrix
+        The second matrix to be multiplied
+    tile_size: Optional[int]
+        The size of the blocks of the NumPy kernel. It defaults to
+        `TROPICAL_TILE_SIZE`
+
+    Returns
+    -------
+    Matrix
+        The min-plus multiplication of the matrices passed as parameters.
+        Its element type is a floating point one, so that it can store
+        `math.inf`, which is the value of the empty minimum
+
+    Raises
+    ------
+    ValueError
+        If the number of columns of `A` is different from the number of
+        rows of `B`
+    '''
+    return _tropical_matrix_mult(A, B, min, tile_size)
+
+
+def max_plus_matrix_mult(A: Matrix, B: Matrix, tile_size: Optional[int] = None) -> Matrix:
+    ''' Multiply two matrices in the max-plus semiring
+
+    The value in position (y, x) of the result is the maximum over k of
+    A[y][k] + B[k][x]. See `min_plus_matrix_mult`.
+
+    Parameters
+    ----------
+    A: Matrix
+        The first matrix to be multiplied
+    B: Matrix
+        The second matrix to be multiplied
+    tile_size: Optional[int]
+        The size of the blocks of the NumPy kernel. It defaults to
+        `TROPICAL_TILE_SIZE`
+
+    Returns
+    -------
+    Matrix
+        The max-plus multiplication of the matrices passed as parameters.
+        Its element type is a floating point one, so that it can store
+        `-math.inf`, which is the value of the empty maximum
+
+    Raises
+    ------
+    ValueError
+        If the number of columns of `A` is different from the number of
+        rows of `B`
+    '''
+    return _tropical_matrix_mult(A, B, max, tile_size)
+
+
+def all_pairs_shortest_paths(W: Matrix) -> Matrix:
+    ''' Compute the lengths of the shortest paths between all the pairs of vertices
+
+    The weight matrix is squared in the min-plus semiring until the paths
+    of every length have been considered: after the i-th squaring, the
+    matrix stores the shortest paths having at most 2^i edges, so
+    Theta(log n) min-plus products are enough.
+
+    Parameters
+    ----------
+    W: Matrix
+        The weight matrix of a graph: W[y][x] is the weight of the edge
+        from the y-th vertex to the x-th one, or `math.inf` if there is
+        no such edge. The diagonal is taken as zero. The graph must not
+        have negative cycles
+
+    Returns
+    -------
+    Matrix
+        The matrix whose value in position (y, x) is the length of the
+        shortest path from the y-th vertex to the x-th one, or `math.inf`
+        if there is no such path
+
+    Raises
+    ------
+    ValueError
+        If `W` is not square
+    '''
+    n = W.num_of_rows
+    if n != W.num_of_cols:
+        raise ValueError('The matrix is not square')
+
+    D = W.astype(DEFAULT_DTYPE if W.dtype in _INTEGER_BOUNDS else W.dtype)
+    for y in range(n):
+        D[y][y] = 0
+
+    edges = 1
+    while edges < n - 1:
+        squared = min_plus_matrix_mult(D, D)
+        if squared._pack() == D._pack():
+            break
+        D = squared
+        edges *= 2
+
+    return D
+
+
+def graph_to_distance_matrix(G) -> Matrix:
+    ''' Build the weight matrix of a graph
+
+    Parameters
+    ----------
+    G: Graph
+        The graph, e.g. a `Graph` of Homework_3: iterating over it yields
+        its nodes, and every node has an `adjacent_dict` mapping the
+        adjacent nodes to the weights of the edges
+
+    Returns
+    -------
+    Matrix
+        The matrix whose value in position (y, x) is 0 if y is equal to x,
+        the weight of the edge from the y-th node to the x-th one if it
+        exists, and `math.inf` otherwise. The nodes are numbered in the
+        order in which they are yielded by `G`
+    '''
+    nodes = list(G)
+    position = {id(node): i for i, node in enumerate(nodes)}
+    n = len(nodes)
+
+    D = Matrix._wrap(array(TYPECODE, [inf]) * (n * n), n, n)
+    for y, node in enumerate(nodes):
+        row = D[y]
+        for adjacent, weight in node.adjacent_dict.items():
+            row[position[id(adjacent)]] = weight
+        row[y] = 0
+
+    return D
+
+
+# The number of columns below which the LU decomposition, and the rows
+# below which the triangular solves, stop the recursion
+LU_BLOCK_SIZE = 32
+
+
+def _swap_rows(A: Matrix, y1: int, y2: int) -> None:
+    if y1 != y2:
+        row = array(A._typecode, A[y1])
+        A[y1][:] = A[y2]
+        A[y2][:] = row
+
+
+def _lu_unblocked(W: Matrix, perm: List[int], col: int, num_of_cols: int) -> None:
+    ''' Factorize the columns from `col` to `col + num_of_cols - 1` of `W` by Gaussian elimination '''
+    n, end = W.num_of_rows, col + num_of_cols
+    if BACKEND == 'numpy':
+        D = W.to_numpy()
+        for k in range(col, end):
+            pivot = k + int(np.argmax(np.abs(D[k:, k])))
+            if pivot != k:
+                D[[k, pivot]] = D[[pivot, k]]
+                perm[k], perm[pivot] = perm[pivot], perm[k]
+            if D[k, k] != 0:
+                D[k + 1:, k] /= D[k, k]
+                D[k + 1:, k + 1:end] -= np.outer(D[k + 1:, k], D[k, k + 1:end])
+        return
+
+    for k in range(col, end):
+        pivot = max(range(k, n), key=lambda y: abs(W[y][k]))
+        _swap_rows(W, k, pivot)
+        perm[k], perm[pivot] = perm[pivot], perm[k]
+
+        pivot_row = W[k]
+        if pivot_row[k] == 0:
+            continue
+        for y in range(k + 1, n):
+            row = W[y]
+            factor = row[k] / pivot_row[k]
+            row[k] = factor
+            if factor != 0:
+                row[k + 1:end] = array(TYPECODE, [a - factor * p for a, p in
+                                                  zip(row[k + 1:end], pivot_row[k + 1:end])])
+
+
+def _lu_into(W: Matrix, perm: List[int], col: int, num_of_cols: int, cutoff: int,
+             block_size: int) -> None:
+    ''' Factorize the columns from `col` to `col + num_of_cols - 1` of `W` in place
+
+    The panel made by the rows of `W` from the `col`-th one is split in
+    two halves of columns. The left half is factorized recursively, the
+    right one is updated by a triangular solve and by the Schur
+    complement of the left half, and then it is factorized recursively.
+    The rows are swapped as a whole, so that `W` always stores the
+    factors of the matrix whose rows are permuted by `perm`.
+    '''
+    if num_of_cols <= block_size:
+        _lu_unblocked(W, perm, col, num_of_cols)
+        return
+
+    n, half = W.num_of_rows, num_of_cols // 2
+    mid, right = col + half, num_of_cols - half
+    _lu_into(W, perm, col, half, cutoff, block_size)
+
+    A12 = W.view(col, half, mid, right)
+    _unit_lower_solve_into(W.view(col, half, col, half), A12, cutoff, block_size)
+    A22 = W.view(mid, n - mid, mid, right)
+    A22 -= strassen_winograd_matrix_mult(W.view(mid, n - mid, col, half), A12, cutoff)
+
+    _lu_into(W, perm, mid, right, cutoff, block_size)
+
+
+def _unit_lower_solve_into(L: Matrix, B: Matrix, cutoff: int, block_size: int) -> None:
+    ''' Solve L X = B in place of `B`, where `L` is unit lower triangular
+
+    Only the values of `L` below the diagonal are read.
+    '''
+    n, cols = L.num_of_rows, B.num_of_cols
+    if n <= block_size:
+        if BACKEND == 'numpy':
+            L_values, X = L.to_numpy(), B.to_numpy()
+            for y in range(1, n):
+                X[y] -= L_values[y, :y] @ X[:y]
+            return
+
+        for y in range(1, n):
+            L_row, row = L[y], B[y]
+            values = row.tolist()
+            for x in range(y):
+                if L_row[x] != 0:
+                    values = [v - L_row[x] * b for v, b in zip(values, B[x])]
+            row[:] = array(TYPECODE, values)
+        return
+
+    half = n // 2
+    B1, B2 = B.view(0, half, 0, cols), B.view(half, n - half, 0, cols)
+    _unit_lower_solve_into(L.view(0, half, 0, half), B1, cutoff, block_size)
+    B2 -= strassen_winograd_matrix_mult(L.view(half, n - half, 0, half), B1, cutoff)
+    _unit_lower_solve_into(L.view(half, n - half, half, n - half), B2, cutoff, block_size)
+
+
+def _upper_solve_into(U: Matrix, B: Matrix, cutoff: int, block_size: int) -> None:
+    ''' Solve U X = B in place of `B`, where `U` is upper triangular
+
+    Only the values of `U` on and above the diagonal are read.
+
+    Raises
+    ------
+    ValueError
+        If `U` is singular
+    '''
+    n, cols = U.num_of_rows, B.num_of_cols
+    if n <= block_size:
+        if BACKEND == 'numpy':
+            U_values, X = U.to_numpy(), B.to_numpy()
+            for y in range(n - 1, -1, -1):
+                if U_values[y, y] == 0:
+                    raise ValueError('The matrix is singular')
+                X[y] -= U_values[y, y + 1:] @ X[y + 1:]
+                X[y] /= U_values[y, y]
+            return
+
+        for y in range(n - 1, -1, -1):
+            U_row, row = U[y], B[y]
+            if U_row[y] == 0:
+                raise ValueError('The matrix is singular')
+            values = row.tolist()
+            for x in range(y + 1, n):
+                if U_row[x] != 0:
+                    values = [v - U_row[x] * b for v, b in zip(values, B[x])]
+            row[:] = array(TYPECODE, [v / U_row[y] for v in values])
+        return
+
+    half = n // 2
+    B1, B2 = B.view(0, half, 0, cols), B.view(half, n - half, 0, cols)
+    _upper_solve_into(U.view(half, n - half, half, n - half), B2, cutoff, block_size)
+    B1 -= strassen_winograd_matrix_mult(U.view(0, half, half, n - half), B2, cutoff)
+    _upper_solve_into(U.view(0, half, 0, half), B1, cutoff, block_size)
+
+
+def _lu_factor(A: Matrix, cutoff: int) -> Tuple[Matrix, List[int]]:
+    ''' Return the factors of `A` packed in one matrix and the row permutation '''
+    if A.num_of_rows != A.num_of_cols:
+        raise ValueError('The matrix is not square')
+
+    W = Matrix._wrap(array(TYPECODE, A._pack()), A.num_of_rows, A.num_of_cols)
+    perm = list(range(A.num_of_rows))
+    _lu_into(W, perm, 0, A.num_of_cols, cutoff, LU_BLOCK_SIZE)
+
+    return W, perm
+
+
+def lu_decomposition(A: Matrix, cutoff: Optional[int] = None) -> Tuple[List[int], LowerTriangularMatrix,
+                                                                       UpperTriangularMatrix]:
+    ''' Compute the LU decomposition of a square matrix with partial pivoting
+
+    The decomposition is computed recursively on halves of the columns:
+    the Schur complements and the triangular solves of the blocks are
+    products computed by Winograd's variant of Strassen's algorithm, so
+    the decomposition takes as many operations as a multiplication, up to
+    a constant factor. The blocks having at most `LU_BLOCK_SIZE` columns
+    are factorized by Gaussian elimination.
+
+    Parameters
+    ----------
+    A: Matrix
+        The matrix to be decomposed
+    cutoff: Optional[int]
+        The cutoff of Strassen's algorithm. It defaults to the calibrated
+        one of the current backend
+
+    Returns
+    -------
+    Tuple[List[int], LowerTriangularMatrix, UpperTriangularMatrix]
+        The permutation `P`, the unit lower triangular matrix `L` and the
+        upper triangular matrix `U` such that the `y`-th row of `L * U`
+        is the `P[y]`-th row of `A`. `U` has a zero on the diagonal if
+        `A` is singular
+
+    Raises
+    ------
+    ValueError
+        If `A` is not square
+    '''
+    if cutoff is None:
+        cutoff = get_strassen_cutoff()
+
+    W, perm = _lu_factor(A, cutoff)
+    n = W.num_of_rows
+    L = LowerTriangularMatrix.__new__(LowerTriangularMatrix)
+    L._init_band(n, n, n, 0)
+    U = UpperTriangularMatrix.__new__(UpperTriangularMatrix)
+    U._init_band(n, n, 0, n)
+    # the k-th diagonal of `W` starts at max(0, -k) * (n + 1) + k
+    L._diagonals = [W._data[-k * n:n * n:n + 1] for k in range(-L._lower, 0)] + [array(TYPECODE, [1]) * n]
+    U._diagonals = [W._data[k:(n - k) * n:n + 1] for k in range(U._upper + 1)]
+
+    return perm, L, U
+
+
+def solve_linear_system(A: Matrix, B: Matrix, cutoff: Optional[int] = None) -> Matrix:
+    ''' Solve the linear system A X = B
+
+    `A` is decomposed by `lu_decomposition` and the two triangular systems
+    are solved recursively on halves of the rows, so that most of the work
+    is done by Winograd's variant of Strassen's algorithm.
+
+    Parameters
+    ----------
+    A: Matrix
+        The square matrix of the coefficients
+    B: Matrix
+        The matrix of the constant terms, one column per system
+    cutoff: Optional[int]
+        The cutoff of Strassen's algorithm. It defaults to the calibrated
+        one of the current backend
+
+    Returns
+    -------
+    Matrix
+        The matrix `X` of the solutions
+
+    Raises
+    ------
+    ValueError
+        If `A` is not square or singular, or if the number of rows of
+        `B` is different from that of `A`
+    '''
+    if A.num_of_rows != B.num_of_rows:
+        raise ValueError('The two matrices have different numbers of rows')
+
+    if cutoff is None:
+        cutoff = get_strassen_cutoff()
+
+    W, perm = _lu_factor(A, cutoff)
+    X = Matrix.zeros(B.num_of_rows, B.num_of_cols)
+    for y, row in enumerate(perm):
+        X[y][:] = array(TYPECODE, B[row])
+    _unit_lower_solve_into(W, X, cutoff, LU_BLOCK_SIZE)
+    _upper_solve_into(W, X, cutoff, LU_BLOCK_SIZE)
+
+    return X
+
+
+def matrix_inverse(A: Matrix, cutoff: Optional[int] = None) -> Matrix:
+    ''' Compute the inverse of a square matrix
+
+    The inverse is the solution of the linear systems A X = I, see
+    `solve_linear_system`.
+
+    Parameters
+    ----------
+    A: Matrix
+        The matrix to be inverted
+    cutoff: Optional[int]
+        The cutoff of Strassen's algorithm. It defaults to the calibrated
+        one of the current backend
+
+    Returns
+    -------
+    Matrix
+        The inverse of `A`
+
+    Raises
+    ------
+    ValueError
+        If `A` is not square or it is singular
+    '''
+    return solve_linear_system(A, IdentityMatrix(A.num_of_rows), cutoff)
+
+
+# The default size of the square tiles streamed by `out_of_core_matrix_mult`
+OUT_OF_CORE_TILE_SIZE = 1024
+
+
+def out_of_core_matrix_mult(A: Matrix, B: Matrix, path: str,
+                            tile_size: Optional[int] = None) -> MappedMatrix:
+    ''' Multiply two matrices, possibly larger than memory, into a file
+
+    The result is computed one square tile at a time: the tiles of `A`
+    and `B` contributing to it are loaded in memory, multiplied by
+    Winograd's variant of Strassen's algorithm and accumulated, then the
+    tile is written to `path`. At most four tiles are in memory at once,
+    whatever the size of the operands, which are typically
+    `MappedMatrix` objects.
+
+    Parameters
+    ----------
+    A: Matrix
+        The first matrix to be multiplied
+    B: Matrix
+        The second matrix to be multiplied
+    path: str
+        The file where the result is stored. It is overwritten
+    tile_size: Optional[int]
+        The size of the tiles. It defaults to `OUT_OF_CORE_TILE_SIZE`
+
+    Returns
+    -------
+    MappedMatrix
+        The row-column multiplication of the matrices passed as
+        parameters, mapped from `path`, with the element type given by
+        `gauss_matrix_mult`
+
+    Raises
+    ------
+    ValueError
+        If the number of columns of `A` is different from the number of
+        rows of `B`
+    OverflowError
+        If the matrices are integer ones and the product may overflow
+    '''
+    if A.num_of_cols != B.num_of_rows:
+        raise ValueError('The two matrices cannot be multiplied')
+    if tile_size is None:
+        tile_size = OUT_OF_CORE_TILE_SIZE
+
+    result = MappedMatrix(path, A.num_of_rows, B.num_of_cols, mode='w+', dtype=_product_dtype(A, B))
+
+    for row in range(0, A.num_of_rows, tile_size):
+        for col in range(0, B.num_of_cols, tile_size):
+            C = None
+            for k in range(0, A.num_of_cols, tile_size):
+                P = strassen_winograd_matrix_mult(A.submatrix(row, tile_size, k, tile_size),
+                                                  B.submatrix(k, tile_size, col, tile_size))
+                if C is None:
+                    C = P
+                else:
+                    C += P
+            if C is not None:
+                result.assign_submatrix(row, col, C)
+
+    result.flush()
+
+    return result
+
+
+def find_nearest_power(Dimension: int) -> int:
+    result = 2
+    while result < Dimension:
+        result *= 2
+    return result
+
+
+def square_matrix(A: Matrix, Dim: int, Number: int) -> Matrix:
+    result = Matrix._wrap(array(A._typecode, [Number]) * (Dim * Dim), Dim, Dim)
+    result.assign_submatrix(0, 0, A)
+    return result
+
+
+def trim_square(A: Matrix, Rows: int, Cols: int) -> Matrix:
+    result = A.submatrix(0, Rows, 0, Cols)
+    return result
+
+
+class Matrix(object):
+    ''' A simple matrix class backed by one contiguous buffer
+
+    The values are stored in row-major order in a flat typed buffer. A
+    matrix is a window on such a buffer: it starts at `_offset` and two
+    consecutive rows are `_stride` positions apart, so that several
+    matrices can share the same storage.
+
+    Members
+    -------
+    _data: array
+        The flat buffer that stores all the matrix values
+    _offset: int
+        The position in `_data` of the first value of the matrix
+    _stride: int
+        The distance in `_data` between the beginnings of two consecutive
+        rows
+    _rows: int
+        The number of rows of the matrix
+    _cols: int
+        The number of columns of the matrix
+
+    Parameters
+    ----------
+    A: List[List[Number]]
+        The list of rows that store all the matrix values
+    clone_matrix: Optional[bool]
+        Kept for compatibility: the values of `A` are always packed into
+        a new buffer.
+    dtype: Optional[str]
+        The element type of the matrix, i.e. one of the keys of `DTYPES`
+
+    Raises
+    ------
+    ValueError
+        If there are two lists having a different number of values or
+        `dtype` is not valid
+    '''
+
+    def __init__(self, A: List[List[Number]], clone_matrix: bool = True,
+                 dtype: str = DEFAULT_DTYPE):
+        num_of_cols = None
+
+        for i, row in enumerate(A):
+            if num_of_cols is not None:
+                if num_of_cols != len(row):
+                    raise ValueError('This is not a matrix')
+            else:
+                num_of_cols = len(row)
+
+        self._data = array(_typecode_of(dtype), [value for row in A for value in row])
+        self._offset = 0
+        self._rows = len(A)
+        self._cols = 0 if num_of_cols is None else num_of_cols
+        self._stride = self._cols
+
+    @staticmethod
+    def _wrap(data: array, num_of_rows: int, num_of_cols: int,
+              offset: int = 0, stride: Optional[int] = None) -> Matrix:
+        ''' Build a matrix on top of an existing buffer without copying it
+
+        Parameters
+        ----------
+        data: array
+            The buffer storing the matrix values
+        num_of_rows: int
+            The number of rows of the matrix
+        num_of_cols: int
+            The number of columns of the matrix
+        offset: Optional[int]
+            The position in `data` of the first value of the matrix
+        stride: Optional[int]
+            The distance in `data` between two consecutive rows. It
+            defaults to `num_of_cols`
+
+        Returns
+        -------
+        Matrix
+            A matrix whose values are stored in `data`
+        '''
+        result = Matrix.__new__(Matrix)
+        result._data = data
+        result._offset = offset
+        result._rows = num_of_rows
+        result._cols = num_of_cols
+        result._stride = num_of_cols if stride is None else stride
+
+        return result
+
+    @staticmethod
+    def zeros(num_of_rows: int, num_of_cols: int, dtype: str = DEFAULT_DTYPE) -> Matrix:
+        ''' Build a matrix whose values are all zero
+
+        Parameters
+        ----------
+        num_of_rows: int
+            The number of rows of the matrix
+        num_of_cols: int
+            The number of columns of the matrix
+        dtype: Optional[str]
+            The element type of the matrix
+
+        Returns
+        -------
+        Matrix
+            A `num_of_rows` x `num_of_cols` zero matrix
+        '''
+        data = array(_typecode_of(dtype), [0]) * (num_of_rows * num_of_cols)
+
+        return Matrix._wrap(data, num_of_rows, num_of_cols)
+
+    @staticmethod
+    def from_numpy(A, dtype: Optional[str] = None) -> Matrix:
+        ''' Build a matrix from a two-dimensional NumPy array
+
+        Parameters
+        ----------
+        A: numpy.ndarray
+            The array storing the matrix values
+        dtype: Optional[str]
+            The element type of the matrix. It defaults to that of `A`, if
+            it is supported, and to `DEFAULT_DTYPE` otherwise
+
+        Returns
+        -------
+        Matrix
+            A matrix storing a copy of the values of `A`
+
+        Raises
+        ------
+        ValueError
+            If `A` is not two-dimensional
+        '''
+        if np.ndim(A) != 2:
+            raise ValueError('This is not a matrix')
+
+        if dtype is None:
+            dtype = np.asarray(A).dtype.name
+            if dtype not in DTYPES:
+                dtype = DEFAULT_DTYPE
+        A = np.ascontiguousarray(A, dtype=dtype)
+        data = array(_typecode_of(dtype))
+        data.frombytes(A.tobytes())
+
+        return Matrix._wrap(data, A.shape[0], A.shape[1])
+
+    def to_numpy(self):
+        ''' Return a NumPy array sharing the values of this matrix
+
+        Returns
+        -------
+        numpy.ndarray
+            A two-dimensional array whose updates are reflected in this
+            matrix and vice versa
+
+        Raises
+        ------
+        RuntimeError
+            If NumPy is not available
+        '''
+        if np is None:
+            raise RuntimeError('NumPy is not available')
+
+        dtype = np.dtype(self._typecode)
+        if self._rows == 0 or self._cols == 0:
+            return np.zeros((self._rows, self._cols), dtype=dtype)
+
+        itemsize = dtype.itemsize
+
+        return np.ndarray((self._rows, self._cols), dtype=dtype, buffer=self._data,
+                          offset=self._offset * itemsize,
+                          strides=(self._stride * itemsize, itemsize))
+
+    @property
+    def num_of_rows(self) -> int:
+        return self._rows
+
+    @property
+    def num_of_cols(self) -> int:
+        if self._rows == 0:
+            return 0
+
+        return self._cols
+
+    @property
+    def dtype(self) -> str:
+        return _dtype_of(self._typecode)
+
+    def astype(self, dtype: str) -> Matrix:
+        ''' Return a copy of this matrix having another element type
+
+        Parameters
+        ----------
+        dtype: str
+            The element type of the copy. Values converted from a floating
+            point type to an integer one are truncated
+
+        Returns
+        -------
+        Matrix
+            A copy of this matrix whose element type is `dtype`
+        '''
+        typecode, data = _typecode_of(dtype), self._pack()
+        if data.typecode != typecode:
+            if dtype in _INTEGER_BOUNDS and self.dtype not in _INTEGER_BOUNDS:
+                data = array(typecode, map(int, data))
+            else:
+                data = array(typecode, data)
+
+        return Matrix._wrap(data, self._rows, self._cols)
+
+    def _max_abs(self) -> Number:
+        ''' Return the largest absolute value of this matrix '''
+        if self._rows == 0 or self._cols == 0:
+            return 0
+
+        if BACKEND == 'numpy':
+            values = self.to_numpy()
+            return max(-values.min().item(), values.max().item())
+
+        data = self._pack()
+
+        return max(-min(data), max(data))
+
+    def density(self) -> float:
+        ''' Return the fraction of non-zero values of this matrix '''
+        size = self._rows * self._cols
+        if size == 0:
+            return 0.0
+
+        if BACKEND == 'numpy':
+            return np.count_nonzero(self.to_numpy()) / size
+
+        data = self._pack()
+
+        return (size - data.count(0)) / size
+
+    def _row_begin(self, y: int) -> int:
+        return self._offset + y * self._stride
+
+    @property
+    def _typecode(self) -> str:
+        ''' The typecode of `_data`, which is either an array or a memoryview '''
+        if isinstance(self._data, array):
+            return self._data.typecode
+
+        return self._data.format
+
+    def _packed(self) -> array:
+        ''' Return the matrix values as a contiguous buffer, without copying if possible '''
+        if (self._offset == 0 and self._stride == self._cols and
+                isinstance(self._data, array) and len(self._data) == self._rows * self._cols):
+            return self._data
+
+        return self._pack()
+
+    def _pack(self) -> array:
+        ''' Return a contiguous copy of the matrix values '''
+        begin, cols = self._offset, self._cols
+        view = memoryview(self._data)
+        data = array(self._typecode)
+        if self._stride == cols:
+            data.frombytes(view[begin:begin + self._rows * cols].cast('B'))
+            return data
+
+        for y in range(self._rows):
+            row_begin = self._row_begin(y)
+            data.frombytes(view[row_begin:row_begin + cols].cast('B'))
+
+        return data
+
+    def copy(self):
+        return Matrix._wrap(self._pack(), self._rows, self._cols)
+
+    def __getitem__(self, y: int):
+        ''' Return one of the rows
+
+        Parameters
+        ----------
+        y: int
+            the index of the rows to be returned
+
+        Returns
+        -------
+        memoryview
+            A writable view on the `y`-th row of the matrix
+        '''
+        if y < 0:
+            y += self._rows
+        if not 0 <= y < self._rows:
+            raise IndexError('row index out of range')
+
+        row_begin = self._row_begin(y)
+
+        return memoryview(self._data)[row_begin:row_begin + self._cols]
+
+    def __iter__(self):
+        for y in range(self._rows):
+            yield self[y]
+
+    def _combine(self, A: Matrix, op) -> None:
+        if (self.num_of_cols != A.num_of_cols or
+                self.num_of_rows != A.num_of_rows):
+            raise ValueError('The two matrices have different sizes')
+
+        if BACKEND == 'numpy':
+            _NUMPY_UFUNCS[op](self.to_numpy(), A.to_numpy(), out=self.to_numpy())
+            return
+
+        data, A_data, cols = self._data, A._data, self._cols
+        for y in range(self._rows):
+            begin, A_begin = self._row_begin(y), A._row_begin(y)
+            data[begin:begin + cols] = array(
+                self._typecode, map(op, data[begin:begin + cols],
+                                   A_data[A_begin:A_begin + cols]))
+
+    def __iadd__(self, A: Matrix) -> Matrix:
+        ''' Sum a matrix to this matrix and update it
+
+        Parameters
+        ----------
+        A: Matrix
+            The matrix to be summed up
+
+        Returns
+        -------
+        Matrix
+            The matrix corresponding to the sum between this matrix and
+            that passed as parameter
+
+        Raises
+        ------
+        ValueError
+            If the two matrices have different sizes
+        '''
+        self._combine(A, add)
+
+        return self
+
+    def __add__(self, A: Matrix) -> Matrix:
+        ''' Sum a matrix to this matrix
+
+        Parameters
+        ----------
+        A: Matrix
+            The matrix to be summed up
+
+        Returns
+        -------
+        Matrix
+            The matrix corresponding to the sum between this matrix and
+            that passed as parameter. It has the element type of the two
+            matrices if they have the same one and `DEFAULT_DTYPE` otherwise
+
+        Raises
+        ------
+        ValueError
+            If the two matrices have different sizes
+        '''
+        res = self.astype(_promote(self, A))
+
+        res += A
+
+        return res
+
+    def __isub__(self, A: Matrix) -> Matrix:
         ''' Subtract a matrix to this matrix and update it
 
         Parameters
         ----------
-        A: Matrix
-            The matrix to be subtracted up
+        A: Matrix
+            The matrix to be subtracted up
+
+        Returns
+        -------
+        Matrix
+            The matrix corresponding to the subtraction between this matrix and
+            that passed as parameter
+
+        Raises
+        ------
+        ValueError
+            If the two matrices have different sizes
+        '''
+        self._combine(A, sub)
+
+        return self
+
+    def __sub__(self, A: Matrix) -> Matrix:
+        ''' Subtract a matrix to this matrix
+
+        Parameters
+        ----------
+        A: Matrix
+            The matrix to be subtracted up
+
+        Returns
+        -------
+        Matrix
+            The matrix corresponding to the subtraction between this matrix and
+            that passed as parameter. Its element type is that of `__add__`
+
+        Raises
+        ------
+        ValueError
+            If the two matrices have different sizes
+        '''
+        res = self.astype(_promote(self, A))
+
+        res -= A
+
+        return res
+
+    def __mul__(self, A: Matrix) -> Matrix:
+        ''' Multiply one matrix to this matrix
+
+        Parameters
+        ----------
+        A: Matrix
+            The matrix which multiplies this matrix
+
+        Returns
+        -------
+        Matrix
+            The row-column multiplication between this matrix and that passed
+            as parameter
+
+        Raises
+        ------
+        ValueError
+            If the number of columns of this matrix is different from the
+            number of rows of `A`
+        '''
+        return matrix_mult(self, A)
+
+    def __pow__(self, k: int) -> Matrix:
+        ''' Raise this matrix to a non-negative integer power
+
+        Parameters
+        ----------
+        k: int
+            The exponent
+
+        Returns
+        -------
+        Matrix
+            This matrix raised to the power `k`, see `matrix_power`
+
+        Raises
+        ------
+        ValueError
+            If this matrix is not square or `k` is not a non-negative
+            integer
+        '''
+        return matrix_power(self, k)
+
+    def save(self, path: str) -> None:
+        ''' Save this matrix in a binary file
+
+        The file consists of `MATRIX_FILE_HEADER` followed by the values in
+        row-major order, so that `Matrix.load` can map it without parsing.
+
+        Parameters
+        ----------
+        path: str
+            The file where the matrix is saved. It is overwritten
+        '''
+        view = memoryview(self._data)
+        with open(path, 'wb') as f:
+            f.write(MATRIX_FILE_HEADER.pack(MATRIX_FILE_MAGIC, MATRIX_FILE_VERSION,
+                                            self._typecode.encode(),
+                                            b'<' if sys.byteorder == 'little' else b'>',
+                                            self._rows, self._cols))
+            if self._stride == self._cols:
+                f.write(view[self._offset:self._offset + self._rows * self._cols].cast('B'))
+            else:
+                for y in range(self._rows):
+                    row_begin = self._row_begin(y)
+                    f.write(view[row_begin:row_begin + self._cols].cast('B'))
+
+    @staticmethod
+    def load(path: str, memory_map: bool = False) -> Matrix:
+        ''' Load a matrix saved by `Matrix.save`
+
+        Parameters
+        ----------
+        path: str
+            The file storing the matrix
+        memory_map: Optional[bool]
+            A flag to map the file in memory instead of reading it. The
+            values are then loaded on demand and cannot be modified
+
+        Returns
+        -------
+        Matrix
+            The matrix stored in the file. It is a read-only `MappedMatrix`
+            whenever `memory_map` is set and the file has the byte order
+            of this machine
+
+        Raises
+        ------
+        ValueError
+            If the file is not a valid matrix file
+        '''
+        with open(path, 'rb') as f:
+            header = f.read(MATRIX_FILE_HEADER.size)
+            if len(header) != MATRIX_FILE_HEADER.size:
+                raise ValueError('{} is not a matrix file'.format(path))
+
+            magic, version, typecode, byteorder, rows, cols = MATRIX_FILE_HEADER.unpack(header)
+            if magic != MATRIX_FILE_MAGIC or version != MATRIX_FILE_VERSION:
+                raise ValueError('{} is not a matrix file'.format(path))
+            typecode = typecode.decode()
+            if typecode not in DTYPES.values():
+                raise ValueError('{} stores unsupported values'.format(path))
+
+            native = byteorder == (b'<' if sys.byteorder == 'little' else b'>')
+            if memory_map and native:
+                return MappedMatrix(path, rows, cols, mode='r', offset=MATRIX_FILE_HEADER.size,
+                                    dtype=_dtype_of(typecode))
+
+            data = array(typecode)
+            try:
+                data.fromfile(f, rows * cols)
+            except EOFError:
+                raise ValueError('{} is too short for the matrix'.format(path))
+
+        if not native:
+            data.byteswap()
+
+        return Matrix._wrap(data, rows, cols)
+
+    def lazy(self) -> MatrixExpression:
+        ''' Return this matrix as a lazy expression
+
+        Sums and subtractions involving the returned expression are not
+        computed until `MatrixExpression.evaluate` is called, e.g.
+        `(A.lazy() + B - C).evaluate(out=D)` fills `D` in a single pass.
+
+        Returns
+        -------
+        MatrixExpression
+            The expression whose value is this matrix
+        '''
+        return MatrixExpression([(1, self)])
+
+    def __rmul__(self, value: Number) -> Matrix:
+        ''' Multiply one matrix by a numeric value
+
+        Parameters
+        ----------
+        value: Number
+            The numeric value which multiplies this matrix
+
+        Returns
+        -------
+        Matrix
+            The multiplication between `value` and this matrix
+
+        Raises
+        ------
+        ValueError
+            If `value` is not a number
+        '''
+
+        if not isinstance(value, Number):
+            raise ValueError('{} is not a number'.format(value))
+
+        data = self._pack()
+        typecode = data.typecode
+        if self.dtype in _INTEGER_BOUNDS and not isinstance(value, Integral):
+            typecode = TYPECODE
+
+        return Matrix._wrap(array(typecode, [value * elem for elem in data]),
+                            self._rows, self._cols)
+
+    def submatrix(self, from_row: int, num_of_rows: int,
+                  from_col: int, num_of_cols: int) -> Matrix:
+        ''' Return a submatrix of this matrix
+
+        Parameters
+        ----------
+        from_row: int
+            The first row to be included in the submatrix to be returned
+        num_of_rows: int
+            The number of rows to be included in the submatrix to be returned
+        from_col: int
+            The first col to be included in the submatrix to be returned
+        num_of_cols: int
+            The number of cols to be included in the submatrix to be returned
+
+        Returns
+        -------
+        Matrix
+            A submatrix of this matrix
+        '''
+        return self.view(from_row, num_of_rows, from_col, num_of_cols).copy()
+
+    def view(self, from_row: int, num_of_rows: int,
+             from_col: int, num_of_cols: int) -> Matrix:
+        ''' Return a submatrix of this matrix sharing its values
+
+        Parameters
+        ----------
+        from_row: int
+            The first row to be included in the view
+        num_of_rows: int
+            The number of rows to be included in the view
+        from_col: int
+            The first col to be included in the view
+        num_of_cols: int
+            The number of cols to be included in the view
+
+        Returns
+        -------
+        Matrix
+            A submatrix whose updates are reflected in this matrix and
+            vice versa
+        '''
+        num_of_rows = max(0, min(num_of_rows, self._rows - from_row))
+        num_of_cols = max(0, min(num_of_cols, self._cols - from_col))
+
+        return Matrix._wrap(self._data, num_of_rows, num_of_cols,
+                            self._row_begin(from_row) + from_col, self._stride)
+
+    def assign_submatrix(self, from_row: int, from_col: int, A: Matrix):
+        data, A_data, cols = self._data, A._data, A._cols
+        for y in range(A._rows):
+            begin, A_begin = self._row_begin(y + from_row) + from_col, A._row_begin(y)
+            data[begin:begin + cols] = A_data[A_begin:A_begin + cols]
+
+    def __repr__(self):
+        return '\n'.join('{}'.format(row.tolist()) for row in self)
+
+
+class BandedMatrix(Matrix):
+    ''' A matrix whose non-zero values lie on a band around the diagonal
+
+    Only the diagonals of the band are stored: the `k`-th one, for
+    `-lower <= k <= upper`, collects the values in position `(y, y + k)`.
+    Products involving a banded matrix skip the zeros outside the band,
+    e.g. multiplying two `n` x `n` banded matrices takes
+    Theta(n * lower * upper) operations. The dense values are built, and
+    then kept, only when they are required by the other `Matrix` methods;
+    they are read-only because the structure cannot be changed.
+
+    Members
+    -------
+    _diagonals: List[array]
+        The diagonals of the band, from the `-lower`-th to the `upper`-th
+    _lower: int
+        The number of diagonals below the main one
+    _upper: int
+        The number of diagonals above the main one
+
+    Parameters
+    ----------
+    A: List[List[Number]]
+        The list of rows that store all the matrix values
+    lower: int
+        The number of diagonals below the main one
+    upper: int
+        The number of diagonals above the main one
+    dtype: Optional[str]
+        The element type of the matrix
+
+    Raises
+    ------
+    ValueError
+        If there are two lists having a different number of values, if
+        a bandwidth is negative, if a non-zero value lies outside the
+        band or if `dtype` is not valid
+    '''
+
+    def __init__(self, A: List[List[Number]], lower: int, upper: int,
+                 dtype: str = DEFAULT_DTYPE):
+        if lower < 0 or upper < 0:
+            raise ValueError('The bandwidths must be non-negative')
+
+        num_of_cols = None
+        for row in A:
+            if num_of_cols is not None:
+                if num_of_cols != len(row):
+                    raise ValueError('This is not a matrix')
+            else:
+                num_of_cols = len(row)
+
+        self._init_band(len(A), 0 if num_of_cols is None else num_of_cols, lower, upper, dtype)
+        for y, row in enumerate(A):
+            for x, value in enumerate(row):
+                if not -self._lower <= x - y <= self._upper:
+                    if value != 0:
+                        raise ValueError('This is not a banded matrix')
+                else:
+                    self._diagonals[x - y + self._lower][y - max(0, y - x)] = value
+
+    def _init_band(self, num_of_rows: int, num_of_cols: int, lower: int, upper: int,
+                   dtype: str = DEFAULT_DTYPE) -> None:
+        self._band_typecode = _typecode_of(dtype)
+        self._rows = num_of_rows
+        self._cols = num_of_cols
+        self._offset = 0
+        self._stride = num_of_cols
+        self._lower = min(lower, max(num_of_rows - 1, 0))
+        self._upper = min(upper, max(num_of_cols - 1, 0))
+        self._diagonals = [array(self._band_typecode, [0]) * self._diagonal_size(k)
+                           for k in range(-self._lower, self._upper + 1)]
+        self._dense = None
+
+    @staticmethod
+    def _wrap(diagonals: Optional[List[array]], num_of_rows: int, num_of_cols: int,
+              lower: int, upper: int, dtype: str = DEFAULT_DTYPE) -> BandedMatrix:
+        ''' Build the most specific banded matrix on top of some diagonals, or of zeros if they are None '''
+        if lower == 0 and upper == 0:
+            cls = DiagonalMatrix
+        elif lower == 0 and upper == max(num_of_cols - 1, 0):
+            cls = UpperTriangularMatrix
+        elif upper == 0 and lower == max(num_of_rows - 1, 0):
+            cls = LowerTriangularMatrix
+        else:
+            cls = BandedMatrix
+
+        result = cls.__new__(cls)
+        result._init_band(num_of_rows, num_of_cols, lower, upper, dtype)
+        if diagonals is not None:
+            result._diagonals = diagonals
+
+        return result
+
+    def _diagonal_size(self, k: int) -> int:
+        return max(0, min(self._rows, self._cols - k) - max(0, -k))
+
+    def _bands(self):
+        ''' Iterate over the diagonals as triples (k, first row, values) '''
+        for k, diagonal in zip(range(-self._lower, self._upper + 1), self._diagonals):
+            yield k, max(0, -k), diagonal
+
+    @property
+    def _typecode(self) -> str:
+        return self._band_typecode
+
+    @property
+    def _data(self) -> memoryview:
+        if self._dense is None:
+            data = array(self._band_typecode, [0]) * (self._rows * self._cols)
+            for k, first, diagonal in self._bands():
+                begin = first * (self._cols + 1) + k
+                data[begin:begin + len(diagonal) * (self._cols + 1):self._cols + 1] = diagonal
+            self._dense = memoryview(data).toreadonly()
+
+        return self._dense
+
+    @property
+    def lower_bandwidth(self) -> int:
+        return self._lower
+
+    @property
+    def upper_bandwidth(self) -> int:
+        return self._upper
+
+    def density(self) -> float:
+        ''' Return the fraction of non-zero values of this matrix '''
+        size = self._rows * self._cols
+        if size == 0:
+            return 0.0
+
+        return sum(len(diagonal) - diagonal.count(0) for diagonal in self._diagonals) / size
+
+    def _max_abs(self) -> Number:
+        return max([0] + [max(-min(diagonal), max(diagonal)) for diagonal in self._diagonals if diagonal])
+
+    def _band_rows(self) -> List[Tuple[int, array]]:
+        ''' Return, for every row, its first column in the band and the values in the band '''
+        rows = []
+        for y in range(self._rows):
+            first, last = max(0, y - self._lower), min(self._cols, y + self._upper + 1)
+            rows.append((first, array(self._band_typecode, [self._diagonals[x - y + self._lower][y - max(0, y - x)]
+                                                 for x in range(first, last)])))
+
+        return rows
+
+    def _band_cols(self) -> List[Tuple[int, array]]:
+        ''' Return, for every column, its first row in the band and the values in the band '''
+        cols = []
+        for x in range(self._cols):
+            first, last = max(0, x - self._upper), min(self._rows, x + self._lower + 1)
+            cols.append((first, array(self._band_typecode, [self._diagonals[x - y + self._lower][y - max(0, y - x)]
+                                                 for y in range(first, last)])))
+
+        return cols
+
+    def _mul_dense(self, A: Matrix) -> Matrix:
+        ''' Multiply this matrix by the dense matrix `A` '''
+        result = Matrix.zeros(self._rows, A.num_of_cols, _product_dtype(self, A))
+        if BACKEND == 'numpy':
+            dense, C = A.to_numpy(), result.to_numpy()
+            for k, first, diagonal in self._bands():
+                if diagonal:
+                    end = first + len(diagonal)
+                    C[first:end] += np.frombuffer(diagonal, dtype=self.dtype)[:, None] * dense[first + k:end + k]
+            return result
+
+        A_data, cols = A._pack(), A.num_of_cols
+        A_cols = [A_data[x::cols] for x in range(cols)]
+        data = result._data
+        for y, (first, values) in enumerate(self._band_rows()):
+            end = first + len(values)
+            data[y * cols:(y + 1) * cols] = array(data.typecode, [sum(map(mul, values, A_col[first:end]))
+                                                                  for A_col in A_cols])
+
+        return result
+
+    def _rmul_dense(self, A: Matrix) -> Matrix:
+        ''' Multiply the dense matrix `A` by this matrix '''
+        result = Matrix.zeros(A.num_of_rows, self._cols, _product_dtype(A, self))
+        if BACKEND == 'numpy':
+            dense, C = A.to_numpy(), result.to_numpy()
+            for k, first, diagonal in self._bands():
+                if diagonal:
+                    end = first + len(diagonal)
+                    C[:, first + k:end + k] += dense[:, first:end] * np.frombuffer(diagonal, dtype=self.dtype)
+            return result
+
+        band_cols = self._band_cols()
+        data, cols = result._data, self._cols
+        for y, A_row in enumerate(A):
+            data[y * cols:(y + 1) * cols] = array(data.typecode, [
+                sum(map(mul, A_row[first:first + len(values)], values))
+                for first, values in band_cols])
+
+        return result
+
+    def _mul_banded(self, A: BandedMatrix) -> BandedMatrix:
+        ''' Multiply this matrix by the banded matrix `A`, diagonal by diagonal '''
+        result = BandedMatrix._wrap(None, self._rows, A._cols,
+                                    min(self._lower + A._lower, max(self._rows - 1, 0)),
+                                    min(self._upper + A._upper, max(A._cols - 1, 0)),
+                                    _product_dtype(self, A))
+        for k, first, diagonal in self._bands():
+            for A_k, A_first, A_diagonal in A._bands():
+                # the values (y, y + k) and (y + k, y + k + A_k) contribute to (y, y + k + A_k)
+                C_k = k + A_k
+                if not -result._lower <= C_k <= result._upper:
+                    continue
+                C_first = max(0, -C_k)
+                begin = max(first, A_first - k)
+                end = min(first + len(diagonal), A_first + len(A_diagonal) - k)
+                if begin >= end:
+                    continue
+
+                C_diagonal = result._diagonals[C_k + result._lower]
+                if BACKEND == 'numpy':
+                    np.frombuffer(C_diagonal, dtype=result.dtype)[begin - C_first:end - C_first] += (
+                        np.frombuffer(diagonal, dtype=self.dtype)[begin - first:end - first] *
+                        np.frombuffer(A_diagonal, dtype=A.dtype)[begin + k - A_first:end + k - A_first])
+                else:
+                    C_diagonal[begin - C_first:end - C_first] = array(C_diagonal.typecode, map(
+                        add, C_diagonal[begin - C_first:end - C_first],
+                        map(mul, diagonal[begin - first:end - first],
+                            A_diagonal[begin + k - A_first:end + k - A_first])))
+
+        return result
+
+    def __iadd__(self, A: Matrix):
+        # the band cannot be updated in place: `+=` falls back to `__add__`
+        return NotImplemented
+
+    def __isub__(self, A: Matrix):
+        return NotImplemented
+
+    def __rmul__(self, A: Union[Number, Matrix]) -> Matrix:
+        ''' Multiply a numeric value or a dense matrix by this matrix
+
+        Parameters
+        ----------
+        A: Union[Number, Matrix]
+            The numeric value or the dense matrix which multiplies this
+            matrix
 
         Returns
         -------
         Matrix
-            The matrix corresponding to the subtraction between this matrix and
-            that passed as parameter
+            A banded matrix with the same structure if `A` is a number,
+            the row-column multiplication otherwise. The element types are
+            those of `Matrix.__rmul__` and `gauss_matrix_mult`
 
         Raises
         ------
         ValueError
-            If the two matrices have different sizes
+            If `A` is neither a number nor a matrix that can be multiplied
+            by this matrix
+        '''
+        if isinstance(A, Matrix):
+            return matrix_mult(A, self)
+        if not isinstance(A, Number):
+            raise ValueError('{} is not a number'.format(A))
+
+        dtype = self.dtype
+        if dtype in _INTEGER_BOUNDS and not isinstance(A, Integral):
+            dtype = DEFAULT_DTYPE
+
+        return BandedMatrix._wrap([array(DTYPES[dtype], [A * value for value in diagonal])
+                                   for diagonal in self._diagonals],
+                                  self._rows, self._cols, self._lower, self._upper, dtype)
+
+
+class DiagonalMatrix(BandedMatrix):
+    ''' A class for diagonal matrices
+
+    Parameters
+    ----------
+    diagonal: List[Number]
+        The values on the diagonal
+    dtype: Optional[str]
+        The element type of the matrix
+    '''
+
+    def __init__(self, diagonal: List[Number], dtype: str = DEFAULT_DTYPE):
+        self._init_band(len(diagonal), len(diagonal), 0, 0, dtype)
+        self._diagonals = [array(self._band_typecode, diagonal)]
+
+    def _mul_dense(self, A: Matrix) -> Matrix:
+        ''' Multiply this matrix by the dense matrix `A`, i.e. scale its rows '''
+        dtype = _product_dtype(self, A)
+        if BACKEND == 'numpy':
+            return Matrix.from_numpy(np.frombuffer(self._diagonals[0], dtype=self.dtype)[:, None] * A.to_numpy(),
+                                     dtype)
+
+        data = array(DTYPES[dtype])
+        for value, row in zip(self._diagonals[0], A):
+            data.extend([value * a for a in row])
+
+        return Matrix._wrap(data, A.num_of_rows, A.num_of_cols)
+
+    def _rmul_dense(self, A: Matrix) -> Matrix:
+        ''' Multiply the dense matrix `A` by this matrix, i.e. scale its columns '''
+        dtype = _product_dtype(A, self)
+        if BACKEND == 'numpy':
+            return Matrix.from_numpy(A.to_numpy() * np.frombuffer(self._diagonals[0], dtype=self.dtype), dtype)
+
+        data, diagonal = array(DTYPES[dtype]), self._diagonals[0]
+        for row in A:
+            data.extend(map(mul, row, diagonal))
+
+        return Matrix._wrap(data, A.num_of_rows, A.num_of_cols)
+
+
+class IdentityMatrix(DiagonalMatrix):
+    ''' A class for identity matrices
+
+    Parameters
+    ----------
+    size: int
+        The size of the identity matrix
+    dtype: Optional[str]
+        The element type of the matrix
+    '''
+
+    def __init__(self, size: int, dtype: str = DEFAULT_DTYPE):
+        super().__init__([1] * size, dtype)
+
+    def _mul_dense(self, A: Matrix) -> Matrix:
+        return A.astype(_promote(self, A))
+
+    def _rmul_dense(self, A: Matrix) -> Matrix:
+        return A.astype(_promote(A, self))
+
+    def _mul_banded(self, A: BandedMatrix) -> BandedMatrix:
+        dtype = _promote(self, A)
+
+        return BandedMatrix._wrap([array(DTYPES[dtype], diagonal) for diagonal in A._diagonals],
+                                  A._rows, A._cols, A._lower, A._upper, dtype)
+
+
+class UpperTriangularMatrix(BandedMatrix):
+    ''' A class for upper triangular matrices
+
+    Parameters
+    ----------
+    A: List[List[Number]]
+        The list of rows that store all the matrix values
+    dtype: Optional[str]
+        The element type of the matrix
+
+    Raises
+    ------
+    ValueError
+        If there are two lists having a different number of values or
+        if a non-zero value lies below the diagonal
+    '''
+
+    def __init__(self, A: List[List[Number]], dtype: str = DEFAULT_DTYPE):
+        super().__init__(A, 0, len(A[0]) if len(A) > 0 else 0, dtype)
+
+
+class LowerTriangularMatrix(BandedMatrix):
+    ''' A class for lower triangular matrices
+
+    Parameters
+    ----------
+    A: List[List[Number]]
+        The list of rows that store all the matrix values
+    dtype: Optional[str]
+        The element type of the matrix
+
+    Raises
+    ------
+    ValueError
+        If there are two lists having a different number of values or
+        if a non-zero value lies above the diagonal
+    '''
+
+    def __init__(self, A: List[List[Number]], dtype: str = DEFAULT_DTYPE):
+        super().__init__(A, len(A), 0, dtype)
+
+
+class MappedMatrix(Matrix):
+    ''' A matrix whose values are stored in a binary file mapped in memory
+
+    The file contains the values in row-major order and in the machine's
+    native format; the operating system loads and evicts its pages on
+    demand, so the matrix can be larger than the available memory.
+
+    Members
+    -------
+    _mmap: mmap.mmap
+        The memory map of the file
+
+    Parameters
+    ----------
+    path: str
+        The file storing the matrix values
+    num_of_rows: int
+        The number of rows of the matrix
+    num_of_cols: int
+        The number of columns of the matrix
+    mode: Optional[str]
+        'r' to map an existing file read-only, 'r+' to map an existing file
+        read-write and 'w+' to create, or overwrite, a zero-filled file
+    offset: Optional[int]
+        The number of bytes preceding the values in the file
+    dtype: Optional[str]
+        The element type of the matrix
+
+    Raises
+    ------
+    ValueError
+        If `mode` or `dtype` is unknown or the file is too short
+    '''
+
+    def __init__(self, path: str, num_of_rows: int, num_of_cols: int,
+                 mode: str = 'r+', offset: int = 0, dtype: str = DEFAULT_DTYPE):
+        if mode not in ('r', 'r+', 'w+'):
+            raise ValueError('{} is not a valid mode'.format(mode))
+
+        typecode = _typecode_of(dtype)
+        size = num_of_rows * num_of_cols * array(typecode).itemsize
+        with open(path, {'r': 'rb', 'r+': 'r+b', 'w+': 'w+b'}[mode]) as f:
+            if mode == 'w+':
+                f.truncate(offset + size)
+            elif os.fstat(f.fileno()).st_size < offset + size:
+                raise ValueError('{} is too short for the matrix'.format(path))
+
+            if size == 0:
+                self._mmap = None
+                data = array(typecode)
+            else:
+                self._mmap = mmap.mmap(f.fileno(), 0,
+                                       access=mmap.ACCESS_READ if mode == 'r' else mmap.ACCESS_WRITE)
+                data = memoryview(self._mmap)[offset:offset + size].cast(typecode)
+
+        self.path = path
+        self._data = data
+        self._offset = 0
+        self._rows = num_of_rows
+        self._cols = num_of_cols
+        self._stride = num_of_cols
+
+    def flush(self) -> None:
+        ''' Write the updated values back to the file '''
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        ''' Unmap the file
+
+        All the rows, views and NumPy arrays obtained from this matrix must
+        have been released before.
         '''
+        if self._mmap is not None:
+            typecode = self._typecode
+            self._data.release()
+            self._mmap.close()
+            self._mmap = None
+            self._data = array(typecode)
+            self._rows = self._cols = self._stride = 0
+
+    def __enter__(self) -> MappedMatrix:
+        return self
 
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class MatrixExpression(object):
+    ''' A lazy linear combination of matrices
+
+    Sums, subtractions and multiplications by numbers of expressions and
+    matrices build a new expression without touching any value; the
+    whole combination is then computed by `evaluate` in a single pass
+    over the operands, without any intermediate matrix.
+
+    Members
+    -------
+    _terms: List[Tuple[Number, Matrix]]
+        The coefficients and the matrices of the combination
+
+    Parameters
+    ----------
+    terms: List[Tuple[Number, Matrix]]
+        The coefficients and the matrices of the combination
+    '''
+
+    def __init__(self, terms: List[Tuple[Number, Matrix]]):
+        self._terms = terms
+
+    @property
+    def num_of_rows(self) -> int:
+        return self._terms[0][1].num_of_rows
+
+    @property
+    def num_of_cols(self) -> int:
+        return self._terms[0][1].num_of_cols
+
+    @staticmethod
+    def _as_terms(A: Union[Matrix, MatrixExpression]) -> List[Tuple[Number, Matrix]]:
+        if isinstance(A, MatrixExpression):
+            return A._terms
+
+        return [(1, A)]
+
+    def _combine(self, A: Union[Matrix, MatrixExpression], sign: Number) -> MatrixExpression:
         if (self.num_of_cols != A.num_of_cols or
                 self.num_of_rows != A.num_of_rows):
             raise ValueError('The two matrices have different sizes')
 
-        for y in range(self.num_of_rows):
-            for x in range(self.num_of_cols):
-                self[y][x] -= A[y][x]
+        return MatrixExpression(self._terms + [(sign * coeff, B) for coeff, B in self._as_terms(A)])
 
-        return self
+    def __add__(self, A: Union[Matrix, MatrixExpression]) -> MatrixExpression:
+        return self._combine(A, 1)
 
-    def __sub__(self, A: Matrix) -> Matrix:
-        ''' Subtract a matrix to this matrix
+    def __sub__(self, A: Union[Matrix, MatrixExpression]) -> MatrixExpression:
+        return self._combine(A, -1)
+
+    def __neg__(self) -> MatrixExpression:
+        return MatrixExpression([(-coeff, A) for coeff, A in self._terms])
+
+    def __rmul__(self, value: Number) -> MatrixExpression:
+        if not isinstance(value, Number):
+            raise ValueError('{} is not a number'.format(value))
+
+        return MatrixExpression([(value * coeff, A) for coeff, A in self._terms])
+
+    def _fused_row(self, y: int):
+        ''' Return an iterator over the values of the `y`-th row of the result '''
+        values = None
+        for coeff, A in self._terms:
+            begin = A._row_begin(y)
+            row = A._data[begin:begin + A._cols]
+            if coeff == -1 and values is not None:
+                values = map(sub, values, row)
+                continue
+
+            if coeff != 1:
+                row = map(mul, repeat(coeff), row)
+            values = row if values is None else map(add, values, row)
+
+        return values
+
+    def _overlaps(self, out: Matrix) -> bool:
+        ''' Whether storing the result into `out` may overwrite values of the terms still to be read
+
+        A term laid out exactly as `out` is safe when it is the first one,
+        which the NumPy kernel reads before writing, or when the rows are
+        fused, since every row is computed before being stored.
+        '''
+        for i, (coeff, A) in enumerate(self._terms):
+            if not _shares_buffer(A, out):
+                continue
+            if (A._data is out._data and A._offset == out._offset and A._stride == out._stride and
+                    (i == 0 or BACKEND == 'python')):
+                continue
+            return True
+
+        return False
+
+    def evaluate(self, out: Optional[Matrix] = None) -> Matrix:
+        ''' Compute the value of this expression
 
         Parameters
         ----------
-        A: Matrix
-            The matrix to be subtracted up
+        out: Optional[Matrix]
+            The matrix, possibly a view, where the result is stored. By
+            default, a new matrix is allocated
 
         Returns
         -------
         Matrix
-            The matrix corresponding to the subtraction between this matrix and
-            that passed as parameter
+            The value of this expression
 
         Raises
         ------
         ValueError
-            If the two matrices have different sizes
+            If `out` has not the size of this expression
         '''
-        res = self.copy()
+        if out is None:
+            dtypes = {A.dtype for coeff, A in self._terms}
+            dtype = dtypes.pop() if len(dtypes) == 1 else DEFAULT_DTYPE
+            if dtype in _INTEGER_BOUNDS and not all(isinstance(coeff, Integral) for coeff, A in self._terms):
+                dtype = DEFAULT_DTYPE
+            out = Matrix.zeros(self.num_of_rows, self.num_of_cols, dtype)
+        elif (self.num_of_cols != out.num_of_cols or
+                self.num_of_rows != out.num_of_rows):
+            raise ValueError('The two matrices have different sizes')
+        elif self._overlaps(out):
+            # Writing `out` would change some values of the terms before
+            # they are read: the result goes through a temporary matrix
+            out.assign_submatrix(0, 0, self.evaluate(Matrix.zeros(out.num_of_rows, out.num_of_cols,
+                                                                  out.dtype)))
+            return out
+
+        if BACKEND == 'numpy':
+            C = out.to_numpy()
+            first_coeff, first = self._terms[0]
+            np.multiply(first_coeff, first.to_numpy(), out=C)
+            for coeff, A in self._terms[1:]:
+                if coeff == 1:
+                    C += A.to_numpy()
+                elif coeff == -1:
+                    C -= A.to_numpy()
+                else:
+                    C += coeff * A.to_numpy()
+            return out
+
+        data, cols = out._data, out._cols
+        for y in range(self.num_of_rows):
+            begin = out._row_begin(y)
+            data[begin:begin + cols] = array(out._typecode, self._fused_row(y))
 
-        res -= A
+        return out
 
-        return res
+    def __repr__(self):
+        return repr(self.evaluate())
 
-    def __mul__(self, A: Matrix) -> Matrix:
-        ''' Multiply one matrix to this matrix
+
+class SparseMatrix(object):
+    ''' A matrix class storing only the non-zero values in CSR format
+
+    Members
+    -------
+    _values: array
+        The non-zero values, row by row
+    _indices: array
+        The column of each value in `_values`
+    _indptr: array
+        The position in `_values` of the first value of each row, followed
+        by the number of non-zero values
+    _rows: int
+        The number of rows of the matrix
+    _cols: int
+        The number of columns of the matrix
+
+    Parameters
+    ----------
+    A: List[List[Number]]
+        The list of rows that store all the matrix values
+    dtype: Optional[str]
+        The element type of the matrix
+
+    Raises
+    ------
+    ValueError
+        If there are two lists having a different number of values or
+        `dtype` is not valid
+    '''
+
+    def __init__(self, A: List[List[Number]], dtype: str = DEFAULT_DTYPE):
+        num_of_cols = None
+
+        self._values = array(_typecode_of(dtype))
+        self._indices = array('q')
+        self._indptr = array('q', [0])
+        for row in A:
+            if num_of_cols is not None:
+                if num_of_cols != len(row):
+                    raise ValueError('This is not a matrix')
+            else:
+                num_of_cols = len(row)
+
+            for x, value in enumerate(row):
+                if value != 0:
+                    self._values.append(value)
+                    self._indices.append(x)
+            self._indptr.append(len(self._values))
+
+        self._rows = len(A)
+        self._cols = 0 if num_of_cols is None else num_of_cols
+
+    @staticmethod
+    def _wrap(values: array, indices: array, indptr: array,
+              num_of_rows: int, num_of_cols: int) -> SparseMatrix:
+        result = SparseMatrix.__new__(SparseMatrix)
+        result._values = values
+        result._indices = indices
+        result._indptr = indptr
+        result._rows = num_of_rows
+        result._cols = num_of_cols
+
+        return result
+
+    @staticmethod
+    def from_matrix(A: Matrix) -> SparseMatrix:
+        ''' Build a sparse matrix storing the non-zero values of `A`
 
         Parameters
         ----------
         A: Matrix
-            The matrix which multiplies this matrix
+            The dense matrix to be converted
 
         Returns
         -------
-        Matrix
-            The row-column multiplication between this matrix and that passed
-            as parameter
-
-        Raises
-        ------
-        ValueError
-            If the number of columns of this matrix is different from the
-            number of rows of `A`
+        SparseMatrix
+            A sparse matrix equal to `A`
         '''
-        return gauss_matrix_mult(self, A)
+        if BACKEND == 'numpy':
+            dense = A.to_numpy()
+            rows, cols = np.nonzero(dense)
+            values = array(A._typecode)
+            values.frombytes(np.ascontiguousarray(dense[rows, cols]).tobytes())
+            indptr = np.zeros(A.num_of_rows + 1, dtype=np.int64)
+            np.cumsum(np.bincount(rows, minlength=A.num_of_rows), out=indptr[1:])
+
+            return SparseMatrix._wrap(values, array('q', cols.tolist()), array('q', indptr.tolist()),
+                                      A.num_of_rows, A.num_of_cols)
+
+        values, indices, indptr = array(A._typecode), array('q'), array('q', [0])
+        for row in A:
+            for x, value in enumerate(row):
+                if value != 0:
+                    values.append(value)
+                    indices.append(x)
+            indptr.append(len(values))
 
-    def __rmul__(self, value: Number) -> Matrix:
-        ''' Multiply one matrix by a numeric value
+        return SparseMatrix._wrap(values, indices, indptr, A.num_of_rows, A.num_of_cols)
+
+    def to_matrix(self) -> Matrix:
+        ''' Return the dense matrix equal to this matrix '''
+        result = Matrix.zeros(self._rows, self._cols, self.dtype)
+        data = result._data
+        for y in range(self._rows):
+            begin = y * self._cols
+            for p in range(self._indptr[y], self._indptr[y + 1]):
+                data[begin + self._indices[p]] = self._values[p]
+
+        return result
+
+    @property
+    def num_of_rows(self) -> int:
+        return self._rows
+
+    @property
+    def num_of_cols(self) -> int:
+        if self._rows == 0:
+            return 0
+
+        return self._cols
+
+    @property
+    def num_of_nonzeros(self) -> int:
+        return len(self._values)
+
+    @property
+    def dtype(self) -> str:
+        return _dtype_of(self._values.typecode)
+
+    def _max_abs(self) -> Number:
+        if not self._values:
+            return 0
+
+        return max(-min(self._values), max(self._values))
+
+    def density(self) -> float:
+        ''' Return the fraction of non-zero values of this matrix '''
+        size = self._rows * self._cols
+
+        return len(self._values) / size if size else 0.0
+
+    def _row(self, y: int) -> Tuple[array, array]:
+        begin, end = self._indptr[y], self._indptr[y + 1]
+
+        return self._indices[begin:end], self._values[begin:end]
+
+    def __getitem__(self, y: int) -> array:
+        ''' Return one of the rows
 
         Parameters
         ----------
-        value: Number
-            The numeric value which multiplies this matrix
+        y: int
+            the index of the rows to be returned
 
         Returns
         -------
-        Matrix
-            The multiplication between `value` and this matrix
+        array
+            A copy of the `y`-th row of the matrix
+        '''
+        if y < 0:
+            y += self._rows
+        if not 0 <= y < self._rows:
+            raise IndexError('row index out of range')
+
+        row = array(self._values.typecode, [0]) * self._cols
+        for x, value in zip(*self._row(y)):
+            row[x] = value
+
+        return row
+
+    def transpose(self) -> SparseMatrix:
+        ''' Return the transpose of this matrix '''
+        counts = array('q', [0]) * (self._cols + 1)
+        for x in self._indices:
+            counts[x + 1] += 1
+        for x in range(self._cols):
+            counts[x + 1] += counts[x]
+
+        indptr = array('q', counts)
+        values = array(self._values.typecode, [0]) * len(self._values)
+        indices = array('q', [0]) * len(self._values)
+        for y in range(self._rows):
+            for x, value in zip(*self._row(y)):
+                values[counts[x]] = value
+                indices[counts[x]] = y
+                counts[x] += 1
+
+        return SparseMatrix._wrap(values, indices, indptr, self._cols, self._rows)
+
+    def _mul_dense(self, A: Matrix) -> Matrix:
+        ''' Multiply this matrix by the dense matrix `A` '''
+        result = Matrix.zeros(self._rows, A.num_of_cols, _product_dtype(self, A))
+        cols = A.num_of_cols
+        if BACKEND == 'numpy':
+            dense, C = A.to_numpy(), result.to_numpy()
+            for y in range(self._rows):
+                indices, values = self._row(y)
+                if indices:
+                    np.matmul(np.frombuffer(values, dtype=self.dtype), dense[np.frombuffer(indices, dtype=np.int64)],
+                              out=C[y])
+            return result
+
+        A_data, data = A._data, result._data
+        for y in range(self._rows):
+            row = [0] * cols
+            for x, value in zip(*self._row(y)):
+                begin = A._row_begin(x)
+                row = [r + value * a for r, a in zip(row, A_data[begin:begin + cols])]
+            data[y * cols:(y + 1) * cols] = array(data.typecode, row)
+
+        return result
+
+    def _rmul_dense(self, A: Matrix) -> Matrix:
+        ''' Multiply the dense matrix `A` by this matrix '''
+        result = Matrix.zeros(A.num_of_rows, self._cols, _product_dtype(A, self))
+        if BACKEND == 'numpy':
+            # (A S)^T = S^T A^T: every row of S^T gathers rows of A^T
+            transpose, dense = self.transpose(), np.ascontiguousarray(A.to_numpy().T)
+            C = np.zeros((self._cols, A.num_of_rows), dtype=result.dtype)
+            for x in range(transpose._rows):
+                indices, values = transpose._row(x)
+                if indices:
+                    np.matmul(np.frombuffer(values, dtype=self.dtype),
+                              dense[np.frombuffer(indices, dtype=np.int64)], out=C[x])
+            result.to_numpy()[...] = C.T
+            return result
+
+        rows = [self._row(x) for x in range(self._rows)]
+        data = result._data
+        for y, A_row in enumerate(A):
+            begin = y * self._cols
+            for a, (indices, values) in zip(A_row, rows):
+                if a != 0:
+                    for x, value in zip(indices, values):
+                        data[begin + x] += a * value
+
+        return result
+
+    def _mul_sparse(self, A: SparseMatrix) -> SparseMatrix:
+        ''' Multiply this matrix by the sparse matrix `A` by Gustavson's algorithm '''
+        values, indices, indptr = array(DTYPES[_product_dtype(self, A)]), array('q'), array('q', [0])
+        for y in range(self._rows):
+            row = {}
+            for k, value in zip(*self._row(y)):
+                for x, A_value in zip(*A._row(k)):
+                    row[x] = row.get(x, 0) + value * A_value
+            for x in sorted(row):
+                if row[x] != 0:
+                    indices.append(x)
+                    values.append(row[x])
+            indptr.append(len(values))
+
+        return SparseMatrix._wrap(values, indices, indptr, self._rows, A.num_of_cols)
+
+    def __mul__(self, A: Union[Matrix, SparseMatrix]) -> Union[Matrix, SparseMatrix]:
+        ''' Multiply one matrix to this matrix
+
+        Parameters
+        ----------
+        A: Union[Matrix, SparseMatrix]
+            The matrix which multiplies this matrix
+
+        Returns
+        -------
+        Union[Matrix, SparseMatrix]
+            The row-column multiplication between this matrix and that
+            passed as parameter. It is sparse if `A` is sparse
 
         Raises
         ------
         ValueError
-            If `value` is not a number
+            If the number of columns of this matrix is different from the
+            number of rows of `A`
         '''
+        if self.num_of_cols != A.num_of_rows:
+            raise ValueError('The two matrices cannot be multiplied')
 
-        if not isinstance(value, Number):
-            raise ValueError('{} is not a number'.format(value))
+        if isinstance(A, SparseMatrix):
+            return self._mul_sparse(A)
 
-        return Matrix([[value * elem for elem in row] for row in self._A],
-                      clone_matrix=False)
+        return self._mul_dense(A)
 
-    def submatrix(self, from_row: int, num_of_rows: int,
-                  from_col: int, num_of_cols: int) -> Matrix:
-        ''' Return a submatrix of this matrix
+    def __rmul__(self, A: Union[Number, Matrix]) -> Union[Matrix, SparseMatrix]:
+        ''' Multiply a numeric value or a dense matrix by this matrix
 
         Parameters
         ----------
-        from_row: int
-            The first row to be included in the submatrix to be returned
-        num_of_rows: int
-            The number of rows to be included in the submatrix to be returned
-        from_col: int
-            The first col to be included in the submatrix to be returned
-        num_of_cols: int
-            The number of cols to be included in the submatrix to be returned
+        A: Union[Number, Matrix]
+            The numeric value or the dense matrix which multiplies this
+            matrix
 
         Returns
         -------
-        Matrix
-            A submatrix of this matrix
+        Union[Matrix, SparseMatrix]
+            A sparse matrix if `A` is a number, the dense row-column
+            multiplication otherwise
+
+        Raises
+        ------
+        ValueError
+            If `A` is neither a number nor a matrix that can be multiplied
+            by this matrix
         '''
-        A = [row[from_col:from_col + num_of_cols]
-             for row in self._A[from_row:from_row + num_of_rows]]
+        if isinstance(A, Number):
+            typecode = self._values.typecode
+            if self.dtype in _INTEGER_BOUNDS and not isinstance(A, Integral):
+                typecode = TYPECODE
+            return SparseMatrix._wrap(array(typecode, [A * value for value in self._values]),
+                                      self._indices, self._indptr, self._rows, self._cols)
 
-        return Matrix(A, clone_matrix=False)
+        if not isinstance(A, Matrix):
+            raise ValueError('{} is not a number'.format(A))
+        if A.num_of_cols != self.num_of_rows:
+            raise ValueError('The two matrices cannot be multiplied')
 
-    def assign_submatrix(self, from_row: int, from_col: int, A: Matrix):
-        for y, row in enumerate(A):
-            self_row = self[y + from_row]
-            for x, value in enumerate(row):
-                self_row[x + from_col] = value
+        return self._rmul_dense(A)
 
     def __repr__(self):
-        return '\n'.join('{}'.format(row) for row in self._A)
-
-
-class IdentityMatrix(Matrix):
-    ''' A class for identity matrices
-
-    Parameters
-    ----------
-    size: int
-        The size of the identity matrix
-    '''
-
-    def __init__(self, size: int):
-        A = [[1 if x == y else 0 for x in range(size)]
-             for y in range(size)]
-
-        super().__init__(A)
+        return '\n'.join('{}'.format(self[y].tolist()) for y in range(self._rows))
 
 
 if __name__ == '__main__':
@@ -509,7 +3467,8 @@ if __name__ == '__main__':
         A = Matrix([[random() for x in range(size)] for y in range(size)])
         B = Matrix([[random() for x in range(size)] for y in range(size)])
 
-        for funct in ['gauss_matrix_mult', 'strassen_matrix_mult', 'strassen_matrix_mult_memory_efficent']:
+        for funct in ['gauss_matrix_mult', 'tiled_matrix_mult', 'strassen_matrix_mult',
+                      'strassen_matrix_mult_memory_efficent']:
             T = timeit(f'{funct}(A, B)', globals=locals(), number=1)
             stdout.write('\t{:.3f}'.format(T))
             stdout.flush()
@@ -1,47 +1,17 @@
 from typing import TypeVar, List, Tuple
 from graph import Graph, Node
-from math import inf
+import math
 import sys
 sys.path.append('../')
-from Heap.binheap import binheap
+from Heap.binheap import indexed_binheap
 
 K = TypeVar('K')
 
-def min_dist_order(a: K, b: K) -> bool:
+def build_queue_dijkstra(G: Graph) -> indexed_binheap:
     """
-    Function defining the order relation for minimal dijkstra distance
-    Parameters
-    ----------
-    a First element to compare
-    b Second element to compare
-
-    Returns Boolean
-    -------
-
-    """
-    return a.dijkstra_distance <= b.dijkstra_distance
-
-
-def min_import_order(a: K, b: K) -> bool:
-    """
-    Function defining the order relation for minimal node importance
-    Parameters
-    ----------
-    a First element to compare
-    b Second element to compare
-
-    Returns Boolean
-    -------
-
-    """
-    return a.importance <= b.importance
-
-
-def build_queue_dijkstra(G: Graph) -> binheap:
-    """
-    Function that build a binheap queue of a graph given in input, using the dijstra distance attribute as the metric
-    to define the order relation. A minor addiction to the binheap class has been added to track the key-switches in
-    the binary heap, without changing the asymptotic complexity of any of the related algorithms.
+    Function that build an indexed binheap queue of a graph given in input, whose handles are the nodes and whose
+    keys are their dijkstra distances. The heap keeps track of the position of every node, so that the distance of
+    any node can be decreased without scanning the queue.
 
     Parameters
     ----------
@@ -49,23 +19,16 @@ def build_queue_dijkstra(G: Graph) -> binheap:
 
     Returns
     -------
-    The binheap
+    The indexed binheap
     """
-    i = 0
-    A = []
-    for v in G:
-        A.append(v)
-        v.binheap_index = i
-        i += 1
-    Q = binheap(A=A, total_order=min_dist_order)
+    Q = indexed_binheap(A=[(v, v.dijkstra_distance) for v in G])
     return Q
 
 
-def build_queue_hierarchies(G: Graph) -> binheap:
+def build_queue_hierarchies(G: Graph) -> indexed_binheap:
     """
-    Function that build a binheap queue of a graph given in input, using the importance attribute as the metric
-    to define the order relation.  A minor addiction to the binheap class has been added to track the key-switches in
-    the binary heap, without changing the asymptotic complexity of any of the related algorithms.
+    Function that build an indexed binheap queue of a graph given in input, whose handles are the nodes and whose
+    keys are their importance.
 
     Parameters
     ----------
@@ -73,15 +36,9 @@ def build_queue_hierarchies(G: Graph) -> binheap:
 
     Returns
     -------
-    The binheap
+    The indexed binheap
     """
-    i = 0
-    A = []
-    for v in G:
-        A.append(v)
-        v.binheap_index = i
-        i += 1
-    Q = binheap(A=A, total_order=min_import_order)
+    Q = indexed_binheap(A=[(v, v.importance) for v in G])
     return Q
 
 
@@ -100,14 +57,14 @@ def init_sssp(G: Graph) -> None:
         v.set_pred(None)
 
 
-def update_distance(Q: binheap, v: Node, d: K) -> None:
+def update_distance(Q: indexed_binheap, v: Node, d: K) -> None:
     """
     Utility function that actually update the attributes of the node during an update_distance iteration and
-    fix the heap properties of the queue
+    fix the heap properties of the queue, if the node is still in it
 
     Parameters
     ----------
-    Q The binheap implementing the queue
+    Q The indexed binheap implementing the queue
     v The node whose distance must be updated
     d The new value of the distance
 
@@ -115,20 +72,18 @@ def update_distance(Q: binheap, v: Node, d: K) -> None:
 
     """
     v.dijkstra_distance = d
-    if d < math.inf:
-        Q.decreaser(v.binheap_index)
-    else:
-        Q._heapify(v.binheap_index)
+    if v in Q:
+        Q.decrease_key(v, d)
 
 
-def relax(Q: binheap, u: Node, v: Node, w: K) -> None:
+def relax(Q: indexed_binheap, u: Node, v: Node, w: K) -> None:
     """
     Utility function which, when necessary, update the distance from the origin node during an iteration
     of the dijkstra algorithm
 
     Parameters
     ----------
-    Q The binheap used as queue
+    Q The indexed binheap used as queue
     u Predecent node
     v Node to update
     w New weight of the edge
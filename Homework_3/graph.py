@@ -18,7 +18,6 @@ class Node(Generic[K]):
         self.dijkstra_pred = None
         self.importance = None
         self.hierarchy = None
-        self.binheap_index = None
 
     def __str__(self) -> str:
         return str(self.index) + ' adjacent: ' + str([x.index for x in self.adjacent_dict])
@@ -1,4 +1,17 @@
-from typing import List
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import sys
+
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import as_strided
+except ImportError:
+    np = None
+
+sys.path.append('../')
+from Homework_1.matrix import Matrix, get_strassen_cutoff, strassen_winograd_matrix_mult
+
 
 def MCM_aux(P, m, s, i, j):
     m[i][j] = None
@@ -22,3 +35,414 @@ def matrix_chain_mult(P: List[int]):
             MCM_aux(P, m, s, i, j)
     return m,s
 
+
+def matrix_chain_mult_vectorized(P: List[int]):
+    '''
+    Compute the same tables as `matrix_chain_mult`, evaluating every
+    diagonal of them as a single NumPy operation: the cells of a diagonal
+    depend only on those of the previous ones, so the costs of all the
+    splits of all the cells of the diagonal are summed at once and the
+    first minimum of each cell is taken by `argmin`, which breaks ties
+    as `MCM_aux` does. Without NumPy, `matrix_chain_mult` is used.
+
+    The i-th row of `m` from its diagonal on and the j-th column of `m` up
+    to its diagonal are read as strided views of `m` and of its transposed
+    copy `mT`, so that no split is gathered by indexing.
+
+    Parameters
+    ----------
+    P: the dimensions of the chain, i.e. the i-th matrix is P[i] x P[i+1]
+
+    Returns
+    -------
+    The cost table `m` and the split table `s` as 2-D NumPy arrays. The
+    costs are 64-bit integers whenever they cannot overflow and Python
+    integers otherwise
+    '''
+    if np is None:
+        return matrix_chain_mult(P)
+
+    n = len(P) - 1
+    if n < 1:
+        raise ValueError('The chain is empty')
+
+    dtype = _cost_dtype(P)
+    m = np.zeros((n, n), dtype=dtype)
+    mT = np.zeros((n, n), dtype=dtype)
+    s = np.zeros((n, n), dtype=np.intp)
+    _wavefront_into(np.array(P, dtype=dtype), m, mT, s, 0)
+    return m, s
+
+
+def _cost_dtype(P: List[int]):
+    # Every cost is a sum of at most n-1 products of three dimensions
+    return np.int64 if len(P)*max(P)**3 < 1 << 63 else object
+
+
+def _wavefront_into(W, m, mT, s, first_col: int) -> None:
+    '''
+    Fill, diagonal by diagonal, the cells of the columns of `m`, `mT` and
+    `s` from `first_col` on, the others being already computed.
+    '''
+    n = len(m)
+    row, col = m.strides
+    diagonal = row + col
+    for diag in range(1, n):
+        start = max(0, first_col - diag)
+        count = n - diag - start
+        if count <= 0:
+            continue
+        i = np.arange(start, start + count)
+        # left[i, k-i] is m[i][k] and right[i, k-i] is m[k+1][i+diag]
+        left = as_strided(m[start:, start:], shape=(count, diag), strides=(diagonal, col),
+                          writeable=False)
+        right = as_strided(mT[start+diag:, start+1:], shape=(count, diag), strides=(diagonal, col),
+                           writeable=False)
+        middle = as_strided(W[start+1:], shape=(count, diag), strides=(W.strides[0], W.strides[0]),
+                            writeable=False)
+        q = left + right + W[start:start+count, None]*middle*W[start+diag+1:start+diag+1+count, None]
+
+        k = q.argmin(axis=1)
+        m[i, i+diag] = mT[i+diag, i] = q[i-start, k]
+        s[i, i+diag] = i + k
+
+
+def approximate_matrix_chain_mult(P: List[int]) -> Tuple[List[Dict[int, int]], List[Dict[int, int]]]:
+    '''
+    Find a near-optimal order for the product of the chain of matrices
+    whose dimensions are `P` in time O(n), by Hu and Shing's approximation
+    of the optimal partition of a convex polygon: the cost of the order is
+    at most 1.155 times the optimal one.
+
+    The chain is seen as the polygon whose vertices are weighted by `P`
+    and whose triangles are the products. Starting from the vertex V1 of
+    minimum weight, the vertices are pushed on a stack and, whenever the
+    top Vt of the stack, the vertex Vt-1 below it and the current vertex
+    Vc satisfy 1/w1 + 1/wt < 1/wt-1 + 1/wc, the triangle Vt-1 Vt Vc is
+    cheaper than the fan from V1 and it is cut off. The remaining polygon
+    is fanned from V1.
+
+    Parameters
+    ----------
+    P: the dimensions of the chain, i.e. the i-th matrix is P[i] x P[i+1]
+
+    Returns
+    -------
+    The cost table `m` and the split table `s`, indexed as those of
+    `matrix_chain_mult`: m[i][j] is the cost of the product of the matrices
+    from the i-th to the j-th one and s[i][j] the index of its split. Every
+    row is a dictionary holding only the sub-chains of the chosen order
+    '''
+    n = len(P) - 1
+    if n < 1:
+        raise ValueError('The chain is empty')
+    m = [{} for i in range(n)]
+    s = [{} for i in range(n)]
+    if n == 1:
+        m[0][0] = 0
+        return m, s
+
+    # apex[(a, c)] is the third vertex of the triangle standing on the
+    # diagonal from vertex a to vertex c, a < c
+    apex = {}
+
+    def cut(a: int, b: int, c: int) -> None:
+        a, b, c = sorted((a, b, c))
+        apex[(a, c)] = b
+
+    first = min(range(n + 1), key=P.__getitem__)
+    w1 = P[first]
+    stack = [first]
+    for step in range(1, n + 1):
+        c = (first + step) % (n + 1)
+        wc = P[c]
+        while len(stack) > 2:
+            wt_1, wt = P[stack[-2]], P[stack[-1]]
+            # 1/w1 + 1/wt < 1/wt-1 + 1/wc in integer arithmetic
+            if wt_1*wt*wc + w1*wt_1*wc >= w1*wt*(wt_1 + wc):
+                break
+            cut(stack[-2], stack.pop(), c)
+        stack.append(c)
+    for b, c in zip(stack[1:], stack[2:]):
+        cut(first, b, c)
+
+    # Visit the tree of the products from the whole chain, i.e. the side
+    # from vertex 0 to vertex n, computing the costs of the sub-chains
+    stack = [(0, n, False)]
+    while stack:
+        a, c, visited = stack.pop()
+        if c - a == 1:
+            m[a][a] = 0
+        elif visited:
+            b = apex[(a, c)]
+            m[a][c-1] = m[a][b-1] + m[b][c-1] + P[a]*P[b]*P[c]
+            s[a][c-1] = b - 1
+        else:
+            b = apex[(a, c)]
+            stack.append((a, c, True))
+            stack.append((b, c, False))
+            stack.append((a, b, False))
+    return m, s
+
+
+def pair_mult(A: Matrix, B: Matrix, cutoff: int) -> Matrix:
+    '''
+    Multiply two matrices by Winograd's variant of Strassen's algorithm,
+    which decides by their shapes how many levels of recursion, if any,
+    are worth and leaves the rest to the classical kernel.
+    '''
+    return strassen_winograd_matrix_mult(A, B, cutoff)
+
+
+# The length from which `chain_multiply` orders the chains by
+# `approximate_matrix_chain_mult` rather than by the cubic `matrix_chain_mult`
+APPROXIMATE_CHAIN_LENGTH = 256
+
+
+def chain_multiply(matrices: List[Matrix], approximate: Optional[bool] = None,
+                   cache: Optional[ChainPlanCache] = None) -> Matrix:
+    '''
+    Multiply a chain of matrices in the order minimising the number of
+    scalar multiplications, i.e. following the split table `s` computed
+    by `matrix_chain_mult`.
+
+    Parameters
+    ----------
+    matrices: the chain of matrices to be multiplied
+    approximate: whether to follow the near-optimal order computed in linear
+        time by `approximate_matrix_chain_mult`. It defaults to True for the
+        chains of at least `APPROXIMATE_CHAIN_LENGTH` matrices
+    cache: a `ChainPlanCache` providing the optimal orders
+
+    Returns
+    -------
+    The product of the chain
+    '''
+    if len(matrices) == 0:
+        raise ValueError('The chain is empty')
+    for A, B in zip(matrices, matrices[1:]):
+        if A.num_of_cols != B.num_of_rows:
+            raise ValueError('The matrices cannot be multiplied')
+    if len(matrices) == 1:
+        return matrices[0].copy()
+
+    P = [matrices[0].num_of_rows] + [A.num_of_cols for A in matrices]
+    if approximate is None:
+        approximate = len(matrices) >= APPROXIMATE_CHAIN_LENGTH
+    if approximate:
+        m, s = approximate_matrix_chain_mult(P)
+    elif cache is not None:
+        return plan_product(matrices, cache.plan(P))
+    else:
+        m, s = matrix_chain_mult_vectorized(P)
+    return chain_product(matrices, s, 0, len(matrices)-1)
+
+
+def chain_product(matrices: List[Matrix], s, i: int, j: int) -> Matrix:
+    '''
+    Multiply the matrices from the i-th to the j-th one following the split
+    table `s`. The parenthesization is visited with an explicit stack, so
+    that long chains do not exceed the recursion limit.
+    '''
+    cutoff = get_strassen_cutoff()
+    products = []
+    stack = [(i, j, False)]
+    while stack:
+        i, j, split = stack.pop()
+        if i == j:
+            products.append(matrices[i])
+        elif split:
+            B = products.pop()
+            A = products.pop()
+            products.append(pair_mult(A, B, cutoff))
+        else:
+            k = s[i][j]
+            stack.append((i, j, True))
+            stack.append((k+1, j, False))
+            stack.append((i, k, False))
+    return products[0]
+
+
+def chain_plan(s, i: int, j: int) -> Tuple[Tuple[int, int, int], ...]:
+    '''
+    Reconstruct from the split table `s` the parenthesization of the
+    product of the matrices from the i-th to the j-th one as the sequence
+    of the triples (i', k, j'), each standing for the product of the
+    matrices from the i'-th to the k-th one by those from the (k+1)-th to
+    the j'-th one, in the order in which they can be computed.
+    '''
+    plan = []
+    stack = [(i, j, False)]
+    while stack:
+        i, j, split = stack.pop()
+        if i == j:
+            continue
+        k = int(s[i][j])
+        if split:
+            plan.append((i, k, j))
+        else:
+            stack.append((i, j, True))
+            stack.append((k+1, j, False))
+            stack.append((i, k, False))
+    return tuple(plan)
+
+
+def plan_product(matrices: List[Matrix], plan: Tuple[Tuple[int, int, int], ...]) -> Matrix:
+    '''
+    Multiply a chain of matrices following the parenthesization `plan`
+    returned by `chain_plan`.
+    '''
+    cutoff = get_strassen_cutoff()
+    products = list(matrices)
+    for i, k, j in plan:
+        # The product of the matrices from the i-th to the j-th one is
+        # stored in position i
+        products[i] = pair_mult(products[i], products[k+1], cutoff)
+    return products[0]
+
+
+class ChainPlanCache(object):
+    '''
+    A least-recently-used cache of the parenthesizations of the chains,
+    keyed by their dimension vectors.
+
+    Every entry keeps the plan, i.e. Theta(n) triples for a chain of n
+    matrices. As the cells of the j-th column of the tables of the dynamic
+    program depend only on the first j+2 dimensions, when a missing chain
+    extends a cached one only the columns of the new matrices are computed.
+    For this, the tables of the most recent chains are kept as well, as
+    long as they fit in `max_table_bytes`: they take Theta(n^2) memory,
+    about 24 bytes per cell with NumPy, i.e. 23 MiB for 1000 matrices.
+
+    Parameters
+    ----------
+    max_size: the number of plans kept in the cache
+    max_table_bytes: the memory, in bytes, taken at most by the tables kept
+        to extend the cached chains. If it is 0, no table is kept
+
+    Attributes
+    ----------
+    hits: the number of plans found in the cache
+    misses: the number of plans computed
+    prefix_hits: the number of misses whose tables extended those of a
+        cached chain
+    '''
+
+    def __init__(self, max_size: int = 128, max_table_bytes: int = 64 << 20):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError('The cache size must be a positive integer')
+        if not isinstance(max_table_bytes, int) or max_table_bytes < 0:
+            raise ValueError('The table budget must be a non-negative integer')
+        self.max_size = max_size
+        self.max_table_bytes = max_table_bytes
+        self.hits = 0
+        self.misses = 0
+        self.prefix_hits = 0
+        self._entries = OrderedDict()
+        # The tables of the most recent chains and the bytes they take
+        self._tables_of = OrderedDict()
+        self._table_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, P) -> bool:
+        return tuple(P) in self._entries
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._tables_of.clear()
+        self._table_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.prefix_hits = 0
+
+    def plan(self, P: List[int]) -> Tuple[Tuple[int, int, int], ...]:
+        '''
+        Return the parenthesization minimising the number of scalar
+        multiplications of the chain whose dimensions are `P`, as returned
+        by `chain_plan`.
+        '''
+        key = tuple(P)
+        if len(key) < 2:
+            raise ValueError('The chain is empty')
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        prefix = self._longest_prefix(key)
+        if prefix is None:
+            tables = self._tables(key)
+        else:
+            self.prefix_hits += 1
+            tables = self._extend_tables(key, len(prefix) - 1, self._tables_of[prefix])
+        plan = chain_plan(tables[-1], 0, len(key) - 2)
+
+        self._entries[key] = plan
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        self._keep_tables(key, tables)
+        return plan
+
+    def _keep_tables(self, key: Tuple[int, ...], tables: tuple) -> None:
+        if key in self._tables_of:
+            self._table_bytes -= self._nbytes(self._tables_of.pop(key))
+        size = self._nbytes(tables)
+        if size > self.max_table_bytes:
+            return
+        self._tables_of[key] = tables
+        self._table_bytes += size
+        while self._table_bytes > self.max_table_bytes:
+            self._table_bytes -= self._nbytes(self._tables_of.popitem(last=False)[1])
+
+    @staticmethod
+    def _nbytes(tables: tuple) -> int:
+        if np is None:
+            return sum(sys.getsizeof(row) + 8*len(row) for T in tables for row in T)
+        # The Python integers of object arrays are not counted
+        return sum(T.nbytes for T in tables)
+
+    def _longest_prefix(self, key: Tuple[int, ...]) -> Optional[Tuple[int, ...]]:
+        prefix = None
+        for cached in self._tables_of:
+            if len(cached) < len(key) and key[:len(cached)] == cached and \
+                    (prefix is None or len(cached) > len(prefix)):
+                prefix = cached
+        if prefix is not None:
+            self._tables_of.move_to_end(prefix)
+        return prefix
+
+    @staticmethod
+    def _tables(P: Tuple[int, ...]) -> tuple:
+        if np is None:
+            return matrix_chain_mult(P)
+        n = len(P) - 1
+        dtype = _cost_dtype(P)
+        m = np.zeros((n, n), dtype=dtype)
+        mT = np.zeros((n, n), dtype=dtype)
+        s = np.zeros((n, n), dtype=np.intp)
+        _wavefront_into(np.array(P, dtype=dtype), m, mT, s, 0)
+        return m, mT, s
+
+    @staticmethod
+    def _extend_tables(P: Tuple[int, ...], first_col: int, tables: tuple) -> tuple:
+        n = len(P) - 1
+        if np is None:
+            old_m, old_s = tables
+            m = [row + [0]*(n - first_col) for row in old_m] + [[0]*n for i in range(n - first_col)]
+            s = [row + [0]*(n - first_col) for row in old_s] + [[0]*n for i in range(n - first_col)]
+            for j in range(first_col, n):
+                for i in range(j - 1, -1, -1):
+                    MCM_aux(P, m, s, i, j)
+            return m, s
+
+        dtype = _cost_dtype(P)
+        m = np.zeros((n, n), dtype=dtype)
+        mT = np.zeros((n, n), dtype=dtype)
+        s = np.zeros((n, n), dtype=np.intp)
+        for new, old in zip((m, mT, s), tables):
+            new[:first_col, :first_col] = old
+        _wavefront_into(np.array(P, dtype=dtype), m, mT, s, first_col)
+        return m, mT, s